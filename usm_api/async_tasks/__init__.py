@@ -1 +1,11 @@
 from async_tasks.tasks import generate_summary
+from async_tasks.queues import (
+    queue_class_for_plan,
+    enqueue_summaries,
+    enqueue_refreshes,
+)
+from async_tasks.scheduling import (
+    dispatch_pending,
+    broker_queue_depth,
+)
+from async_tasks.refresh import refresh_summary, refresh_watched_summaries
@@ -15,7 +15,29 @@ celery_app.conf.update(
     timezone=Config.TIMEZONE,
     enable_utc=False,
     imports=[],  # Import Tasks
+    # Beat tasks use their own queue, so they neither count against the
+    # summarization queue targets nor wait behind summary work
+    beat_schedule={
+        # Sends new summaries, finished tasks also refill their queue slot
+        "dispatch-pending-summaries": {
+            "task": "async_tasks.scheduling.dispatch_pending_summaries",
+            "schedule": Config.SUMMARIZATION_DISPATCH_INTERVAL,
+            "options": {"queue": Config.MAINTENANCE_QUEUE},
+        },
+        "reclaim-expired-leases": {
+            "task": "async_tasks.scheduling.reclaim_expired_leases",
+            "schedule": Config.LEASE_RECLAIM_INTERVAL,
+            "options": {"queue": Config.MAINTENANCE_QUEUE},
+        },
+        "refresh-watched-summaries": {
+            "task": "async_tasks.refresh.refresh_watched_summaries",
+            "schedule": Config.REFRESH_TICK_INTERVAL,
+            "options": {"queue": Config.MAINTENANCE_QUEUE},
+        },
+    },
 )
 
 # celery cmd
-# celery -A async_tasks.celery_init:celery_app worker -l info -P gevent -Q summarization_queue
+# celery -A async_tasks.celery_init:celery_app worker -l info -P gevent -Q summarization_priority,summarization_queue
+# celery -A async_tasks.celery_init:celery_app worker -l info -c 1 -Q summarization_maintenance
+# celery -A async_tasks.celery_init:celery_app beat -l info
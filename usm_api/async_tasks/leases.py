@@ -0,0 +1,41 @@
+import os
+import socket
+from datetime import datetime, timedelta
+from sqlalchemy import update, or_
+from sqlalchemy.orm import Session
+from config import Config
+from models import db_models
+
+
+def lease_owner(task_id: str | None) -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{task_id}"
+
+
+def lease_expiry() -> datetime:
+    return datetime.now() + timedelta(seconds=Config.SUMMARY_LEASE_SECONDS)
+
+
+def claim_summary(
+    db_session: Session, summary_id: int, owner: str, processed: bool = False
+) -> bool:
+    """
+    Atomically take the lease on an unprocessed summary, or on a processed
+    one when refreshing it.
+
+    The conditional UPDATE only matches rows without a live lease, so of two
+    workers handed the same id exactly one sees a changed row.
+    """
+    result = db_session.execute(
+        update(db_models.Summary)
+        .where(
+            db_models.Summary.id == summary_id,
+            db_models.Summary.processed == processed,
+            or_(
+                db_models.Summary.lease_owner.is_(None),
+                db_models.Summary.lease_expires_at < datetime.now(),
+            ),
+        )
+        .values(lease_owner=owner, lease_expires_at=lease_expiry())
+    )
+    db_session.commit()
+    return result.rowcount == 1
@@ -0,0 +1,115 @@
+import time
+from datetime import datetime
+from pytz import timezone
+from sqlalchemy.orm import Session
+from config import Config
+from models import db_models
+from utility import logger
+from async_tasks.leases import lease_expiry
+
+_TZ = timezone(Config.TIMEZONE)
+
+
+class PhaseTracker:
+    """
+    Moves a Summary through its status phases and times each of them.
+
+    Every transition is committed so rows in progress show where they are,
+    and the durations in seconds are stored in ``phase_timings`` once the row
+    reaches done or failed. The queued phase runs from row creation to the
+    first phase of the task.
+    """
+
+    def __init__(self, db_session: Session, summary: db_models.Summary):
+        self.db_session = db_session
+        self.summary = summary
+        self.timings = dict(summary.phase_timings or {})
+        # Earlier attempts already accounted for part of the time since creation
+        processed = sum(
+            seconds
+            for phase, seconds in self.timings.items()
+            if phase not in ("queued", "total")
+        )
+        self.timings["queued"] = max(
+            self.seconds_since(summary.created_at) - processed, 0.0
+        )
+        self.phase = None
+        self.phase_started_at = None
+
+    @staticmethod
+    def seconds_since(moment: datetime) -> float:
+        # MySQL hands back naive datetimes in the configured timezone
+        if moment.tzinfo is None:
+            moment = _TZ.localize(moment)
+        return max((datetime.now(_TZ) - moment).total_seconds(), 0.0)
+
+    @property
+    def released_lease(self) -> dict:
+        return {"lease_owner": None, "lease_expires_at": None}
+
+    def release(self) -> None:
+        """Give up the lease so a retry of the task can claim the row again"""
+        self.save_quietly(**self.released_lease)
+
+    def close_phase(self) -> None:
+        if self.phase is not None:
+            elapsed = time.monotonic() - self.phase_started_at
+            self.timings[self.phase] = self.timings.get(self.phase, 0.0) + elapsed
+            self.phase = None
+
+    def save(self, **values) -> None:
+        for field, value in values.items():
+            setattr(self.summary, field, value)
+        self.db_session.add(self.summary)
+        self.db_session.commit()
+
+    def save_quietly(self, **values) -> None:
+        # Progress updates are best effort, they must not fail the task
+        try:
+            self.save(**values)
+        except Exception as e:
+            logger.warning(f"Error in saving status of summary {self.summary.id} : {e}")
+            self.db_session.rollback()
+
+    def enter(self, phase: str) -> None:
+        phase = db_models.SummaryStatus(phase).value
+        if phase == self.phase:
+            return
+        self.close_phase()
+        self.phase, self.phase_started_at = phase, time.monotonic()
+        # Every transition also renews the lease taken by claim_summary
+        self.save_quietly(status=phase, lease_expires_at=lease_expiry())
+
+    def close_timings(self) -> None:
+        self.close_phase()
+        self.timings["total"] = sum(
+            seconds for phase, seconds in self.timings.items() if phase != "total"
+        )
+
+    def requeue(self) -> None:
+        """Put the row back to queued, keeping the timings of this attempt"""
+        self.close_phase()
+        self.save_quietly(
+            status=db_models.SummaryStatus.QUEUED.value,
+            phase_timings=dict(self.timings),
+            **self.released_lease,
+        )
+
+    def finish(self, status: db_models.SummaryStatus, **values) -> dict:
+        """Close the current phase and store the final status with timings"""
+        self.close_timings()
+        self.save(
+            status=status.value,
+            phase_timings=dict(self.timings),
+            **self.released_lease,
+            **values,
+        )
+        return self.timings
+
+    def fail(self) -> None:
+        self.close_timings()
+        self.save_quietly(
+            status=db_models.SummaryStatus.FAILED.value,
+            phase_timings=dict(self.timings),
+            **self.released_lease,
+        )
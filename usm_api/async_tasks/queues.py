@@ -0,0 +1,36 @@
+from config import Config
+from utility.queueing import get_fair_queue
+
+
+def queue_class_for_plan(plan: str | None) -> str:
+    queue_class = Config.PLAN_QUEUE_CLASSES.get(plan, Config.DEFAULT_QUEUE_CLASS)
+    if queue_class not in Config.SUMMARIZATION_QUEUES:
+        return Config.DEFAULT_QUEUE_CLASS
+    return queue_class
+
+
+def enqueue_summaries(
+    user_id: int, queue_class: str, requests: list[tuple[int, str | None]]
+) -> None:
+    """Queue summaries in a queue class until the dispatcher sends them"""
+    if queue_class not in Config.SUMMARIZATION_QUEUES:
+        queue_class = Config.DEFAULT_QUEUE_CLASS
+    get_fair_queue().push(
+        queue_class,
+        user_id,
+        [
+            {"id": summary_id, "page_digest": page_digest}
+            for summary_id, page_digest in requests
+        ],
+    )
+
+
+def enqueue_refreshes(user_id: int, queue_class: str, summary_ids: list[int]) -> None:
+    """Queue refresh checks, they take their turn like any summary of the user"""
+    if queue_class not in Config.SUMMARIZATION_QUEUES:
+        queue_class = Config.DEFAULT_QUEUE_CLASS
+    get_fair_queue().push(
+        queue_class,
+        user_id,
+        [{"id": summary_id, "task": "refresh"} for summary_id in summary_ids],
+    )
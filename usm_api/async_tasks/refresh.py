@@ -0,0 +1,184 @@
+import math
+from datetime import datetime, timedelta
+from collections import defaultdict
+from sqlalchemy import select, update
+from async_tasks.celery_init import celery_app
+from async_tasks.tasks import summary_cache, publish_summary_event
+from async_tasks.worker import worker_resources
+from async_tasks.leases import claim_summary, lease_owner
+from async_tasks.queues import enqueue_refreshes
+from config import Config
+from models import db_models
+from utility import logger
+from utility import database_helper
+from utility.http import http_fetcher
+from utility.storage import get_page_store
+from utility.rate_limit import RateLimitExceeded
+from summarization_tools import get_summary_tool
+
+
+def next_check_at(watch_interval: int | None) -> datetime | None:
+    if watch_interval is None:
+        return None
+    return datetime.now() + timedelta(minutes=watch_interval)
+
+
+@celery_app.task(bind=True, max_retries=3, default_retry_delay=60)
+def refresh_summary(self, summary_id: int) -> str:
+    """
+    Re-check the page of a processed summary and regenerate it when it changed.
+
+    The page is fetched with the stored ETag and Last-Modified validators, a
+    304 or extracted text matching the stored content digest ends the refresh
+    without calling the LLM. Returns "not_modified", "unchanged", "updated",
+    "failed" or "skipped".
+    """
+    db_session = database_helper.SessionLocal()
+    try:
+        summary_object = db_session.execute(
+            select(db_models.Summary)
+            .where(
+                db_models.Summary.id == summary_id,
+                db_models.Summary.is_deleted == False,
+                db_models.Summary.processed == True,
+            )
+            .limit(1)
+        ).scalar_one_or_none()
+        if summary_object is None:
+            logger.info(f"No processed summary with id {summary_id} to refresh")
+            return "skipped"
+
+        # Manual and scheduled refreshes of one row must not run side by side
+        if not claim_summary(
+            db_session, summary_id, lease_owner(self.request.id), processed=True
+        ):
+            logger.info(f"Summary id {summary_id} is being refreshed, skipping")
+            return "skipped"
+
+        url, user_id = summary_object.url, summary_object.user_id
+        backend = summary_object.backend
+        checked = {
+            "last_checked_at": datetime.now(),
+            "next_check_at": next_check_at(summary_object.watch_interval),
+            "lease_owner": None,
+            "lease_expires_at": None,
+        }
+
+        try:
+            page = http_fetcher.fetch_sync(
+                url,
+                etag=summary_object.etag,
+                last_modified=summary_object.last_modified,
+            )
+            if page.not_modified:
+                outcome, values = "not_modified", {}
+            elif page.status_code != 200:
+                raise ValueError(f"HTTP status {page.status_code} while loading {url}")
+            else:
+                page_digest = None if page.truncated else get_page_store().put(page)
+                summarizer = get_summary_tool(
+                    backend, url, page_digest=page_digest, llm=worker_resources.llm
+                )
+                content_hash = summary_cache.content_hash(summarizer.document_text())
+                values = {**page.validators, "content_digest": content_hash}
+
+                if content_hash == summary_object.content_digest:
+                    outcome = "unchanged"
+                else:
+                    outcome = "updated"
+                    # Only the chunks that changed reach the LLM, see chunk_cache
+                    summary_text = None
+                    if summarizer.shareable:
+                        summary_text = summary_cache.get(url, content_hash)
+                    if summary_text is None:
+                        summary_text = summarizer.summarize()
+                        if summarizer.shareable:
+                            summary_cache.set(url, content_hash, summary_text)
+                    values["summary"] = summary_text
+        except Exception as e:
+            # The old summary stays in place, release it for the next check
+            db_session.rollback()
+            db_session.execute(
+                update(db_models.Summary)
+                .where(db_models.Summary.id == summary_id)
+                .values(**checked)
+            )
+            db_session.commit()
+            if isinstance(e, RateLimitExceeded):
+                logger.warning(
+                    f"LLM rate limit reached refreshing id {summary_id}, "
+                    f"retrying in {e.retry_after:.1f}s"
+                )
+                raise self.retry(exc=e, countdown=math.ceil(e.retry_after))
+            logger.error(f"Error in refreshing summary id {summary_id} : {e}")
+            return "failed"
+
+        db_session.execute(
+            update(db_models.Summary)
+            .where(db_models.Summary.id == summary_id)
+            .values(**checked, **values)
+        )
+        db_session.commit()
+    finally:
+        db_session.close()
+
+    logger.info(f"Refreshed summary id {summary_id} : {outcome}")
+    if outcome == "updated":
+        publish_summary_event(user_id, summary_id, "summary.completed")
+    return outcome
+
+
+@celery_app.task
+def refresh_watched_summaries() -> int:
+    """
+    Queue the watched summaries that are due for a check, within the budget.
+
+    Checks go through the fair queue in the owner's class, so watched pages
+    never run ahead of other users' summaries.
+    """
+    db_session = database_helper.SessionLocal()
+    due_ids = defaultdict(list)
+    try:
+        now = datetime.now()
+        due = db_session.execute(
+            select(
+                db_models.Summary.id,
+                db_models.Summary.user_id,
+                db_models.Summary.queue_class,
+                db_models.Summary.watch_interval,
+            )
+            .where(
+                db_models.Summary.next_check_at <= now,
+                db_models.Summary.watch_interval.is_not(None),
+                db_models.Summary.processed == True,
+                db_models.Summary.is_deleted == False,
+            )
+            .order_by(db_models.Summary.next_check_at)
+            .limit(Config.REFRESH_CHECKS_PER_TICK)
+        ).all()
+        for summary_id, user_id, queue_class, watch_interval in due:
+            # Compare and set, so overlapping ticks never send a row twice
+            result = db_session.execute(
+                update(db_models.Summary)
+                .where(
+                    db_models.Summary.id == summary_id,
+                    db_models.Summary.next_check_at <= now,
+                )
+                .values(next_check_at=next_check_at(watch_interval))
+            )
+            if result.rowcount == 1:
+                due_ids[(user_id, queue_class)].append(summary_id)
+        db_session.commit()
+    except Exception as e:
+        logger.error(f"Error in scheduling summary refreshes : {e}")
+        db_session.rollback()
+        return 0
+    finally:
+        db_session.close()
+
+    for (user_id, queue_class), summary_ids in due_ids.items():
+        enqueue_refreshes(user_id, queue_class, summary_ids)
+    count = sum(len(summary_ids) for summary_ids in due_ids.values())
+    if count:
+        logger.info(f"Scheduled refresh checks for {count} watched summaries")
+    return count
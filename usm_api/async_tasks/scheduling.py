@@ -0,0 +1,185 @@
+import threading
+from datetime import datetime, timedelta
+from collections import defaultdict
+from celery import group
+from sqlalchemy import select, update
+from celery.signals import task_postrun
+from async_tasks.celery_init import celery_app
+from async_tasks.tasks import generate_summary, inflight_registry
+from async_tasks.refresh import refresh_summary
+from async_tasks.queues import enqueue_summaries
+from config import Config
+from models import db_models
+from utility import logger
+from utility import database_helper
+from utility.queueing import get_fair_queue
+
+_dispatching = threading.local()
+
+
+def broker_queue_depth(queue: str) -> int:
+    with celery_app.connection_or_acquire() as connection:
+        return connection.default_channel.queue_declare(queue=queue).message_count
+
+
+def task_signature(item: dict, queue: str):
+    if item.get("task") == "refresh":
+        return refresh_summary.signature(args=[item["id"]], queue=queue)
+    return generate_summary.signature(
+        args=[item["id"]], kwargs={"page_digest": item["page_digest"]}, queue=queue
+    )
+
+
+def dispatch_pending() -> int:
+    """
+    Top every broker queue up to SUMMARIZATION_QUEUE_TARGET from the fair queue.
+
+    Keeping the broker queues short is what makes the fair queue effective, a
+    backlog has to wait there where it is interleaved with other users.
+    """
+    if getattr(_dispatching, "active", False):
+        return 0
+
+    _dispatching.active = True
+    dispatched = 0
+    try:
+        fair_queue = get_fair_queue()
+        for queue_class, queue in Config.SUMMARIZATION_QUEUES.items():
+            budget = Config.SUMMARIZATION_QUEUE_TARGET
+            if not celery_app.conf.task_always_eager:
+                try:
+                    budget -= broker_queue_depth(queue)
+                except Exception as e:
+                    logger.warning(f"Error in reading depth of queue {queue} : {e}")
+
+            items = fair_queue.pop(queue_class, budget)
+            if not items:
+                continue
+            group(task_signature(item, queue) for item in items).apply_async()
+            dispatched += len(items)
+            logger.info(f"Dispatched {len(items)} summaries to {queue}")
+    finally:
+        _dispatching.active = False
+    return dispatched
+
+
+@celery_app.task
+def dispatch_pending_summaries() -> int:
+    return dispatch_pending()
+
+
+@celery_app.task
+def reclaim_expired_leases() -> int:
+    """
+    Requeue summaries whose worker died or stalled while holding the lease.
+
+    Also requeues single-flight followers whose flight is gone while they
+    are still queued. A leader that waited in the fair queue for longer than
+    SINGLE_FLIGHT_TTL would never fill them. Requeued followers lose their
+    flight_leader_id, so they are requeued at most once.
+    """
+    db_session = database_helper.SessionLocal()
+    reclaimed = defaultdict(list)
+    stranded_count = 0
+    try:
+        now = datetime.now()
+        expired = db_session.execute(
+            select(
+                db_models.Summary.id,
+                db_models.Summary.user_id,
+                db_models.Summary.queue_class,
+            )
+            .where(
+                db_models.Summary.lease_expires_at < now,
+                db_models.Summary.processed == False,
+                db_models.Summary.is_deleted == False,
+            )
+            .limit(Config.LEASE_RECLAIM_BATCH)
+        ).all()
+        for summary_id, user_id, queue_class in expired:
+            # Compare and set, a worker may have renewed the lease meanwhile
+            result = db_session.execute(
+                update(db_models.Summary)
+                .where(
+                    db_models.Summary.id == summary_id,
+                    db_models.Summary.lease_expires_at < now,
+                )
+                .values(
+                    lease_owner=None,
+                    lease_expires_at=None,
+                    status=db_models.SummaryStatus.QUEUED.value,
+                )
+            )
+            if result.rowcount == 1:
+                reclaimed[(user_id, queue_class)].append((summary_id, None))
+
+        # Any flight a follower joined has expired once the follower is older
+        # than the TTL, a leader still registered belongs to a newer flight
+        # or was promoted from the followers and keeps them
+        joined_before = now - timedelta(seconds=Config.SINGLE_FLIGHT_TTL)
+        followers = db_session.execute(
+            select(
+                db_models.Summary.id,
+                db_models.Summary.user_id,
+                db_models.Summary.queue_class,
+                db_models.Summary.url,
+            )
+            .where(
+                db_models.Summary.flight_leader_id.is_not(None),
+                db_models.Summary.status == db_models.SummaryStatus.QUEUED.value,
+                db_models.Summary.lease_owner.is_(None),
+                db_models.Summary.created_at < joined_before,
+                db_models.Summary.processed == False,
+                db_models.Summary.is_deleted == False,
+            )
+            .order_by(db_models.Summary.id)
+            .limit(Config.LEASE_RECLAIM_BATCH)
+        ).all()
+        for summary_id, user_id, queue_class, url in followers:
+            if inflight_registry.leader(url) is not None:
+                continue
+            # Keep updated_at, listings and phase statistics are ordered by it
+            result = db_session.execute(
+                update(db_models.Summary)
+                .where(
+                    db_models.Summary.id == summary_id,
+                    db_models.Summary.flight_leader_id.is_not(None),
+                    db_models.Summary.processed == False,
+                )
+                .values(
+                    flight_leader_id=None,
+                    updated_at=db_models.Summary.updated_at,
+                )
+            )
+            if result.rowcount == 1:
+                reclaimed[(user_id, queue_class)].append((summary_id, None))
+                stranded_count += 1
+        db_session.commit()
+    except Exception as e:
+        logger.error(f"Error in reclaiming expired summary leases : {e}")
+        db_session.rollback()
+        return 0
+    finally:
+        db_session.close()
+
+    # Back into the class the row was first queued in
+    for (user_id, queue_class), requests in reclaimed.items():
+        enqueue_summaries(user_id, queue_class, requests)
+    count = sum(len(requests) for requests in reclaimed.values())
+    if count:
+        logger.warning(
+            f"Reclaimed {count - stranded_count} summaries with expired leases "
+            f"and {stranded_count} followers of expired flights"
+        )
+        dispatch_pending()
+    return count
+
+
+@task_postrun.connect(sender=generate_summary)
+@task_postrun.connect(sender=refresh_summary)
+def dispatch_after_summary(**kwargs):
+    # A finished task frees a slot, refill it without waiting for beat
+    try:
+        dispatch_pending()
+    except Exception as e:
+        logger.warning(f"Error in dispatching pending summaries : {e}")
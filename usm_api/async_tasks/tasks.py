@@ -1,13 +1,150 @@
+import math
+from datetime import datetime
+from collections import defaultdict
 from async_tasks.celery_init import celery_app
+from config import Config
 from utility import database_helper
 from models import db_models
-from sqlalchemy import select
+from sqlalchemy import select, update
 from utility import logger
-from summarization_tools import SummaryTool
+from summarization_tools import (
+    SUMMARY_BACKENDS,
+    get_summary_tool,
+    provider_health,
+)
+from utility.cache import SummaryCache, InFlightRegistry
+from utility.events import get_event_bus, PartialSummaryWriter
+from utility.rate_limit import RateLimitExceeded
+from async_tasks.worker import worker_resources
+from async_tasks.phases import PhaseTracker
+from async_tasks.leases import claim_summary, lease_owner
+from async_tasks.queues import enqueue_summaries
+
+summary_cache = SummaryCache()
+inflight_registry = InFlightRegistry()
+
+
+def is_shareable(backend: str) -> bool:
+    """Whether rows of this backend are cached and coalesced across users"""
+    tool = SUMMARY_BACKENDS.get(backend)
+    return tool is not None and tool.shareable
+
+
+def select_backend(summary_id: int, backend: str) -> str:
+    fallback = Config.SUMMARY_FALLBACK_BACKEND
+    if fallback and backend != fallback and provider_health.is_degraded(backend):
+        logger.warning(
+            f"Backend {backend} is degraded, summarizing id {summary_id} with {fallback}"
+        )
+        return fallback
+    return backend
+
+
+def fallback_summary(summarizer, summary_id: int) -> str | None:
+    """Summarize the loaded page with the fallback backend after a failure"""
+    fallback = Config.SUMMARY_FALLBACK_BACKEND
+    if not fallback or summarizer.name == fallback:
+        return None
+    provider_health.mark_degraded(summarizer.name)
+    try:
+        summary_text = get_summary_tool(
+            fallback, summarizer.url, documents=summarizer.document
+        ).summarize()
+    except Exception as e:
+        logger.error(f"Error in {fallback} fallback for summary id {summary_id} : {e}")
+        return None
+    logger.warning(f"Summary id {summary_id} generated by fallback backend {fallback}")
+    return summary_text
+
+
+def publish_summary_event(user_id: int, summary_id: int, event_type: str) -> None:
+    """Notify the user's connected clients, delivery is best effort"""
+    try:
+        get_event_bus().publish(
+            user_id,
+            {
+                "type": event_type,
+                "id": summary_id,
+                "status": "done" if event_type == "summary.completed" else "failed",
+            },
+        )
+    except Exception as e:
+        logger.warning(f"Error in publishing {event_type} for id {summary_id} : {e}")
+
+
+def requeue_summaries(
+    db_session, summary_ids: list[int], queue_class: str | None = None
+) -> None:
+    """Send rows back through the fair queue, in queue_class or their own"""
+    rows = db_session.execute(
+        select(
+            db_models.Summary.id,
+            db_models.Summary.user_id,
+            db_models.Summary.queue_class,
+        ).where(db_models.Summary.id.in_(summary_ids))
+    ).all()
+    requests = defaultdict(list)
+    for summary_id, user_id, row_class in rows:
+        requests[(user_id, queue_class or row_class)].append((summary_id, None))
+    for (user_id, queue_class), user_requests in requests.items():
+        enqueue_summaries(user_id, queue_class, user_requests)
+
+
+def fill_followers(
+    db_session,
+    url: str,
+    summary_id: int,
+    summary_text: str,
+    backend: str,
+    content_digest: str | None = None,
+) -> None:
+    """
+    Complete the single-flight led by summary_id and fill coalesced rows.
+
+    Followers are recorded with the backend that actually produced the text,
+    which differs from the requested one when the leader fell back.
+    """
+    follower_ids = inflight_registry.complete(url, summary_id)
+    if not follower_ids:
+        return
+
+    try:
+        followers = db_session.execute(
+            select(db_models.Summary.id, db_models.Summary.user_id).where(
+                db_models.Summary.id.in_(follower_ids),
+                db_models.Summary.processed == False,
+            )
+        ).all()
+        db_session.execute(
+            update(db_models.Summary)
+            .where(
+                db_models.Summary.id.in_(follower_ids),
+                db_models.Summary.processed == False,
+            )
+            .values(
+                summary=summary_text,
+                backend=backend,
+                content_digest=content_digest,
+                processed=True,
+                status=db_models.SummaryStatus.DONE.value,
+            )
+        )
+        db_session.commit()
+        logger.info(f"Filled summaries {follower_ids} from leader id {summary_id}")
+        for follower_id, user_id in followers:
+            publish_summary_event(user_id, follower_id, "summary.completed")
+    except Exception as e:
+        logger.error(f"Error in filling followers of summary id {summary_id} : {e}")
+        db_session.rollback()
+        # Followers fall back to their own tasks, served by the summary cache
+        try:
+            requeue_summaries(db_session, follower_ids)
+        except Exception as e:
+            logger.error(f"Error in requeueing followers {follower_ids} : {e}")
 
 
 @celery_app.task(bind=True, max_retries=3, default_retry_delay=60)
-def generate_summary(self, summary_id: int) -> None:
+def generate_summary(self, summary_id: int, page_digest: str | None = None) -> None:
     db_session = database_helper.SessionLocal()
     logger.info(f"Request received to generate summary for id {summary_id}")
 
@@ -32,29 +169,128 @@ def generate_summary(self, summary_id: int) -> None:
         logger.info(
             f"Summary already processed for id {summary_id}, skipping generation"
         )
+        if is_shareable(summary_object.backend):
+            fill_followers(
+                db_session,
+                summary_object.url,
+                summary_id,
+                summary_object.summary,
+                summary_object.backend,
+                summary_object.content_digest,
+            )
+        db_session.close()
+        return
+
+    # Redeliveries and retries can hand the same id to two workers at once
+    if not claim_summary(db_session, summary_id, lease_owner(self.request.id)):
+        logger.info(f"Summary id {summary_id} is claimed by another worker, skipping")
+        db_session.close()
         return
 
     url = summary_object.url
+    user_id = summary_object.user_id
+    tracker = PhaseTracker(db_session, summary_object)
+    writer = PartialSummaryWriter(user_id, summary_id)
+    # Rows in a single flight, the backend used may still change on fallback
+    shareable = is_shareable(summary_object.backend)
+    backend = select_backend(summary_id, summary_object.backend)
+    summarizer, error = None, None
 
-    # Generate Summary
-    summarizer = SummaryTool(url)
-    summary_text = summarizer.summarize()
+    # Generate Summary, reusing a cached summary of identical page content
+    try:
+        summarizer = get_summary_tool(
+            backend,
+            url,
+            page_digest=page_digest,
+            llm=worker_resources.llm,
+            on_phase=tracker.enter,
+        )
+        tracker.enter(db_models.SummaryStatus.SUMMARIZING)
+        content_hash = summary_cache.content_hash(summarizer.document_text())
+        summary_text = None
+        if summarizer.shareable:
+            summary_text = summary_cache.get(url, content_hash)
+
+        if summary_text is not None:
+            logger.info(f"Summary cache hit for id {summary_id}, skipping generation")
+        else:
+            # Clients follow the reduce step as it streams, see /{id}/stream
+            summary_text = summarizer.summarize(writer=writer)
+            if summarizer.shareable:
+                summary_cache.set(url, content_hash, summary_text)
+    except Exception as e:
+        # Out of LLM budget, come back once the shared bucket has refilled
+        if (
+            isinstance(e, RateLimitExceeded)
+            and self.request.retries < Config.LLM_RATE_LIMIT_MAX_RETRIES
+        ):
+            logger.warning(
+                f"LLM rate limit reached for id {summary_id}, "
+                f"retrying in {e.retry_after:.1f}s"
+            )
+            tracker.requeue()
+            db_session.close()
+            raise self.retry(
+                exc=e,
+                countdown=math.ceil(e.retry_after),
+                max_retries=Config.LLM_RATE_LIMIT_MAX_RETRIES,
+            )
+
+        logger.error(f"Error in generating summary for id {summary_id} : {e}")
+        error = e
+        # A loaded page can still be summarized locally, never cached though
+        summary_text = None
+        if summarizer is not None:
+            summary_text = fallback_summary(summarizer, summary_id)
+        if summary_text is not None:
+            backend = Config.SUMMARY_FALLBACK_BACKEND
+            content_hash = summary_cache.content_hash(summarizer.document_text())
+
+    if summary_text is None:
+        tracker.fail()
+        # Hand the coalesced requests over to one of the followers
+        new_leader_id = None
+        if shareable:
+            new_leader_id = inflight_registry.abandon(url, summary_id)
+        if new_leader_id is not None:
+            try:
+                # In the best class of the flight, followers keep their place
+                requeue_summaries(
+                    db_session, [new_leader_id], inflight_registry.queue_class(url)
+                )
+            except Exception as e:
+                logger.error(f"Error in requeueing new leader {new_leader_id} : {e}")
+        publish_summary_event(user_id, summary_id, "summary.failed")
+        writer.close()
+        db_session.close()
+        raise error
 
     try:
         # Update and Save Summary Object
-        summary_object.summary = summary_text
-        summary_object.processed = True
-
-        db_session.add(summary_object)
-        db_session.commit()
-        db_session.refresh(summary_object)
+        timings = tracker.finish(
+            db_models.SummaryStatus.DONE,
+            summary=summary_text,
+            processed=True,
+            backend=backend,
+            content_digest=content_hash,
+            last_checked_at=datetime.now(),
+        )
 
     except Exception as e:
         logger.error(f"Error in saving summary with id {summary_id} : {e}")
         db_session.rollback()
+        if self.request.retries >= self.max_retries:
+            tracker.fail()
+            publish_summary_event(user_id, summary_id, "summary.failed")
+        else:
+            tracker.release()
         db_session.close()
         raise self.retry(exc=e)
 
-    logger.info(f"Generated summary for id {summary_id}")
+    logger.info(f"Generated summary for id {summary_id} in {timings['total']:.2f}s")
+    publish_summary_event(user_id, summary_id, "summary.completed")
+    writer.close()
+    if shareable:
+        fill_followers(db_session, url, summary_id, summary_text, backend, content_hash)
     db_session.close()
     return
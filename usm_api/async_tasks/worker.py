@@ -0,0 +1,90 @@
+from celery.signals import (
+    worker_init,
+    worker_shutdown,
+    worker_process_init,
+    worker_process_shutdown,
+)
+from sqlalchemy import text
+from config import Config
+from utility import logger
+from utility import database_helper
+from utility.http import http_fetcher
+from summarization_tools import create_llm
+
+
+class WorkerResources:
+    """
+    Clients shared by every task running in a worker process.
+
+    Prefork children bootstrap themselves after the fork, while gevent, eventlet,
+    thread and solo pools share one process and bootstrap once at worker init
+    with pools sized to the worker concurrency.
+    """
+
+    def __init__(self):
+        self.llm = None
+        self.concurrency = 0
+
+    def start(self, concurrency: int) -> None:
+        self.concurrency = max(concurrency, 1)
+
+        # One connection per concurrently running task plus a little headroom
+        engine = database_helper.configure_engine(
+            pool_size=self.concurrency, max_overflow=Config.WORKER_DB_POOL_OVERFLOW
+        )
+        http_fetcher.configure_limits(
+            max_connections=self.concurrency * 2,
+            max_keepalive_connections=self.concurrency,
+        )
+        self.llm = create_llm()
+
+        try:
+            connections = [engine.connect() for _ in range(self.concurrency)]
+            connections[0].execute(text("SELECT 1"))
+            for connection in connections:
+                connection.close()
+            http_fetcher.sync_client
+        except Exception as e:
+            logger.warning(f"Error in warming worker resources : {e}")
+
+        logger.info(f"Worker resources ready for concurrency {self.concurrency}")
+
+    def stop(self) -> None:
+        if not self.concurrency:
+            return
+        http_fetcher.close()
+        database_helper.dispose_engine()
+        self.llm = None
+        self.concurrency = 0
+        logger.info("Worker resources released")
+
+
+worker_resources = WorkerResources()
+
+
+def is_prefork_pool(worker) -> bool:
+    pool = worker.pool_cls
+    name = pool if isinstance(pool, str) else getattr(pool, "__module__", "")
+    return name in ("prefork", "processes") or name.endswith(".prefork")
+
+
+@worker_init.connect
+def init_worker(sender=None, **kwargs):
+    if not is_prefork_pool(sender):
+        worker_resources.start(sender.concurrency)
+
+
+@worker_process_init.connect
+def init_worker_process(**kwargs):
+    # Every prefork child runs one task at a time
+    worker_resources.start(1)
+
+
+@worker_shutdown.connect
+def shutdown_worker(**kwargs):
+    worker_resources.stop()
+
+
+@worker_process_shutdown.connect
+def shutdown_worker_process(**kwargs):
+    worker_resources.stop()
@@ -0,0 +1,102 @@
+"""
+Requests/sec of the request context middleware against the previous pair of
+BaseHTTPMiddleware classes (AuthMiddleware + DBSessionMiddleware).
+
+User lookup is stubbed in both variants so only middleware overhead is
+measured.
+
+    python -m benchmarks.middleware_benchmark --requests 5000 --concurrency 50
+"""
+
+import time
+import asyncio
+import argparse
+import jwt
+import httpx
+from types import SimpleNamespace
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+from config import Config
+from middlewares import RequestContextMiddleware
+from utility import database_helper
+
+SECRET_KEY = Config.SECRET_KEY or "benchmark-secret"
+STUB_USER = SimpleNamespace(id=1, is_active=True)
+
+
+class LegacyAuthMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        token = request.headers["Authorization"].split(" ", 1)[1].strip()
+        payload = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
+        if payload.get("user_id") is None:
+            raise ValueError("Token payload does not contain user identifier")
+        request.state.user = STUB_USER
+        return await call_next(request)
+
+
+class LegacyDBSessionMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        request.state.db = database_helper.SessionLocal
+        return await call_next(request)
+
+
+class StubbedRequestContextMiddleware(RequestContextMiddleware):
+    def __init__(self, app):
+        super().__init__(app)
+        self.secret_key = SECRET_KEY
+
+    async def load_user(self, db, user_id: int):
+        return STUB_USER
+
+
+def build_app(variant: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/summarizer/list")
+    async def list_endpoint(request: Request):
+        return {"user_id": request.state.user.id}
+
+    if variant == "legacy":
+        app.add_middleware(LegacyAuthMiddleware)
+        app.add_middleware(LegacyDBSessionMiddleware)
+    else:
+        app.add_middleware(StubbedRequestContextMiddleware)
+    return app
+
+
+async def run(variant: str, total: int, concurrency: int) -> float:
+    token = jwt.encode({"user_id": 1}, SECRET_KEY, algorithm="HS256")
+    headers = {"Authorization": f"Bearer {token}"}
+    transport = httpx.ASGITransport(app=build_app(variant))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://benchmark"
+    ) as client:
+
+        async def call():
+            async with semaphore:
+                response = await client.get("/summarizer/list", headers=headers)
+                response.raise_for_status()
+
+        # Warm up
+        await asyncio.gather(*[call() for _ in range(min(total, 200))])
+
+        started = time.perf_counter()
+        await asyncio.gather(*[call() for _ in range(total)])
+        return total / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    for variant in ("legacy", "asgi"):
+        throughput = asyncio.run(run(variant, args.requests, args.concurrency))
+        print(f"{variant:>6}: {throughput:,.0f} requests/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,13 +14,137 @@ class Config:
     SQL_DB_URL = (
         f"mysql+pymysql://{SQL_USER}:{SQL_PASSWORD}@{SQL_HOST}:{SQL_PORT}/{SQL_DB_NAME}"
     )
+    SQL_ASYNC_DB_URL = f"mysql+aiomysql://{SQL_USER}:{SQL_PASSWORD}@{SQL_HOST}:{SQL_PORT}/{SQL_DB_NAME}"
+    SQL_POOL_RECYCLE = int(os.getenv("SQL_POOL_RECYCLE", "1800"))
+    # Connections a worker process may open beyond one per concurrent task
+    WORKER_DB_POOL_OVERFLOW = int(os.getenv("WORKER_DB_POOL_OVERFLOW", "2"))
 
     SECRET_KEY = os.getenv("SECRET_KEY")
+    ACCESS_TOKEN_LIFETIME_MINUTES = int(
+        os.getenv("ACCESS_TOKEN_LIFETIME_MINUTES", "15")
+    )
+    REFRESH_TOKEN_LIFETIME_DAYS = int(os.getenv("REFRESH_TOKEN_LIFETIME_DAYS", "7"))
+    TOKEN_VERSION_CACHE_TTL = int(os.getenv("TOKEN_VERSION_CACHE_TTL", "30"))
     BROKER_URL = os.getenv("BROKER_URL")
 
     TIMEZONE = os.getenv("TIMEZONE", "Asia/Kolkata")
     SUMMARIZATION_LLM_MODEL = os.getenv("SUMMARIZATION_LLM_MODEL")
-    SUMMARIZATION_METHOD = os.getenv("  ", "map_reduce")
+    # auto picks stuff or map_reduce from the document size, map_reduce
+    # partials collapse until they fit within the max rounds
+    SUMMARIZATION_METHOD = os.getenv("SUMMARIZATION_METHOD", "auto")
+    SUMMARIZATION_STUFF_MAX_TOKENS = int(
+        os.getenv("SUMMARIZATION_STUFF_MAX_TOKENS", "8000")
+    )
+    SUMMARIZATION_MAX_COLLAPSE_ROUNDS = int(
+        os.getenv("SUMMARIZATION_MAX_COLLAPSE_ROUNDS", "10")
+    )
+    # Summarization backends a plan may use, the first one is its default
+    PLAN_SUMMARY_BACKENDS = json.loads(os.getenv("PLAN_SUMMARY_BACKENDS", "{}"))
+    DEFAULT_SUMMARY_BACKENDS = json.loads(
+        os.getenv("DEFAULT_SUMMARY_BACKENDS", '["llm", "extractive"]')
+    )
+    # Used when the LLM fails or is degraded, empty to fail the summary instead
+    SUMMARY_FALLBACK_BACKEND = os.getenv("SUMMARY_FALLBACK_BACKEND", "extractive")
+    LLM_DEGRADED_COOLDOWN = int(os.getenv("LLM_DEGRADED_COOLDOWN", "60"))
+    EXTRACTIVE_SUMMARY_SENTENCES = int(os.getenv("EXTRACTIVE_SUMMARY_SENTENCES", "7"))
+    EXTRACTIVE_MAX_SENTENCES = int(os.getenv("EXTRACTIVE_MAX_SENTENCES", "1000"))
     LLM_API_KEY = os.getenv("GOOGLE_API_KEY")
+    SUMMARIZATION_CHUNK_TOKENS = int(os.getenv("SUMMARIZATION_CHUNK_TOKENS", "4000"))
+    SUMMARIZATION_TOKEN_MAX = int(os.getenv("SUMMARIZATION_TOKEN_MAX", "1000"))
+    SUMMARIZATION_MAX_CONCURRENCY = int(os.getenv("SUMMARIZATION_MAX_CONCURRENCY", "4"))
+    SUMMARIZATION_REQUESTS_PER_MINUTE = int(
+        os.getenv("SUMMARIZATION_REQUESTS_PER_MINUTE", "60")
+    )
+    SUMMARIZATION_TOKENS_PER_MINUTE = int(
+        os.getenv("SUMMARIZATION_TOKENS_PER_MINUTE", "1000000")
+    )
+    # Longer waits for LLM budget are handed back to Celery as a task retry
+    LLM_RATE_LIMIT_MAX_WAIT = float(os.getenv("LLM_RATE_LIMIT_MAX_WAIT", "5"))
+    LLM_RATE_LIMIT_MAX_RETRIES = int(os.getenv("LLM_RATE_LIMIT_MAX_RETRIES", "20"))
+
+    CACHE_BACKEND = os.getenv("CACHE_BACKEND", "redis")
+    CACHE_URL = os.getenv("CACHE_URL", BROKER_URL)
+    SUMMARY_CACHE_TTL = int(os.getenv("SUMMARY_CACHE_TTL", "86400"))
+    SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv("SUMMARY_CACHE_MAX_ENTRIES", "10000"))
+    CHUNK_CACHE_TTL = int(os.getenv("CHUNK_CACHE_TTL", str(7 * 86400)))
+    CHUNK_CACHE_MAX_ENTRIES = int(os.getenv("CHUNK_CACHE_MAX_ENTRIES", "100000"))
+    SINGLE_FLIGHT_TTL = int(os.getenv("SINGLE_FLIGHT_TTL", "900"))
+
+    HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "10"))
+    HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+    HTTP_MAX_KEEPALIVE_CONNECTIONS = int(
+        os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20")
+    )
+    FETCH_MAX_BYTES = int(os.getenv("FETCH_MAX_BYTES", str(5 * 1024 * 1024)))
+
+    # Local directory must be shared between API and workers (e.g. a volume)
+    PAGE_STORE_BACKEND = os.getenv("PAGE_STORE_BACKEND", "local")
+    PAGE_STORE_DIR = os.getenv("PAGE_STORE_DIR", "page_store")
+    PAGE_STORE_MAX_BYTES = int(
+        os.getenv("PAGE_STORE_MAX_BYTES", str(1024 * 1024 * 1024))
+    )
+
+    # Workers renew their lease on every phase, expired ones are reclaimed
+    SUMMARY_LEASE_SECONDS = int(os.getenv("SUMMARY_LEASE_SECONDS", "900"))
+    LEASE_RECLAIM_INTERVAL = float(os.getenv("LEASE_RECLAIM_INTERVAL", "60"))
+    LEASE_RECLAIM_BATCH = int(os.getenv("LEASE_RECLAIM_BATCH", "100"))
+
+    # Watched summaries are re-checked with conditional GETs, at most
+    # REFRESH_CHECKS_PER_TICK of them every REFRESH_TICK_INTERVAL seconds
+    REFRESH_TICK_INTERVAL = float(os.getenv("REFRESH_TICK_INTERVAL", "60"))
+    REFRESH_CHECKS_PER_TICK = int(os.getenv("REFRESH_CHECKS_PER_TICK", "50"))
+    REFRESH_DEFAULT_INTERVAL_MINUTES = int(
+        os.getenv("REFRESH_DEFAULT_INTERVAL_MINUTES", "360")
+    )
+    REFRESH_MIN_INTERVAL_MINUTES = int(os.getenv("REFRESH_MIN_INTERVAL_MINUTES", "15"))
+
+    PHASE_STATS_WINDOW_MINUTES = int(os.getenv("PHASE_STATS_WINDOW_MINUTES", "60"))
+    PHASE_STATS_MAX_SAMPLES = int(os.getenv("PHASE_STATS_MAX_SAMPLES", "1000"))
+    # Rows without progress for this long are reported as stuck
+    STUCK_SUMMARY_MINUTES = int(os.getenv("STUCK_SUMMARY_MINUTES", "30"))
+
+    SUMMARY_PREVIEW_LENGTH = int(os.getenv("SUMMARY_PREVIEW_LENGTH", "200"))
+
+    # Summarization queue per class, highest priority first
+    SUMMARIZATION_QUEUES = json.loads(
+        os.getenv(
+            "SUMMARIZATION_QUEUES",
+            '{"priority": "summarization_priority", "standard": "summarization_queue"}',
+        )
+    )
+    # Queue class per subscription plan name, others use the default class
+    PLAN_QUEUE_CLASSES = json.loads(os.getenv("PLAN_QUEUE_CLASSES", "{}"))
+    DEFAULT_QUEUE_CLASS = os.getenv("DEFAULT_QUEUE_CLASS", "standard")
+    # Tasks kept waiting in each broker queue, the rest wait in the fair queue
+    SUMMARIZATION_QUEUE_TARGET = int(os.getenv("SUMMARIZATION_QUEUE_TARGET", "20"))
+    # Queue of the dispatch, reclaim and refresh scheduling beat tasks
+    MAINTENANCE_QUEUE = os.getenv("MAINTENANCE_QUEUE", "summarization_maintenance")
+    # New summaries wait in the fair queue for at most one dispatch interval
+    SUMMARIZATION_DISPATCH_INTERVAL = float(
+        os.getenv("SUMMARIZATION_DISPATCH_INTERVAL", "1")
+    )
+
+    EVENT_STREAM_HEARTBEAT = int(os.getenv("EVENT_STREAM_HEARTBEAT", "15"))
+    # Streamed summary output is flushed to clients at most this often
+    SUMMARY_STREAM_FLUSH_INTERVAL = float(
+        os.getenv("SUMMARY_STREAM_FLUSH_INTERVAL", "0.1")
+    )
+    SUMMARY_STREAM_TTL = int(os.getenv("SUMMARY_STREAM_TTL", "900"))
+
+    # Maximum URLs per batch request keyed by subscription plan name
+    BATCH_SUMMARIZE_LIMITS = json.loads(os.getenv("BATCH_SUMMARIZE_LIMITS", "{}"))
+    BATCH_SUMMARIZE_DEFAULT_LIMIT = int(
+        os.getenv("BATCH_SUMMARIZE_DEFAULT_LIMIT", "10")
+    )
+    BATCH_VALIDATION_CONCURRENCY = int(os.getenv("BATCH_VALIDATION_CONCURRENCY", "10"))
+
+    # Request budgets at the API edge, per user and shared by a plan, keyed by
+    # plan name as {"per_minute": ..., "burst": ...}
+    ADMISSION_STORE = os.getenv("ADMISSION_STORE", "memory")
+    ADMISSION_USER_LIMITS = json.loads(os.getenv("ADMISSION_USER_LIMITS", "{}"))
+    ADMISSION_DEFAULT_USER_LIMIT = json.loads(
+        os.getenv("ADMISSION_DEFAULT_USER_LIMIT", '{"per_minute": 120, "burst": 30}')
+    )
+    ADMISSION_PLAN_LIMITS = json.loads(os.getenv("ADMISSION_PLAN_LIMITS", "{}"))
 
     CORS_ALLOWED_ORIGINS = json.loads(os.getenv("CORS_ALLOWED_ORIGINS", "[]"))
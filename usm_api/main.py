@@ -1,15 +1,31 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from config import Config
 from utility import logger
-from routes import summarizer_router
-from middlewares import AuthMiddleware, DBSessionMiddleware, CORSMiddleware
+from routes import summarizer_router, auth_router
+from middlewares import (
+    RequestContextMiddleware,
+    AdmissionControlMiddleware,
+    CORSMiddleware,
+)
 from exceptions import register_exception_handlers
+from utility.http import http_fetcher
+from utility.events import event_hub
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Release pooled upstream connections and event subscriptions on shutdown
+    await http_fetcher.aclose()
+    await event_hub.close()
+
 
-app = FastAPI(prefix="/usm")
+app = FastAPI(prefix="/usm", lifespan=lifespan)
 
-# Add Middleware
-app.add_middleware(AuthMiddleware)
-app.add_middleware(DBSessionMiddleware)
+# Add Middleware, the last one added runs first
+app.add_middleware(AdmissionControlMiddleware)
+app.add_middleware(RequestContextMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=Config.CORS_ALLOWED_ORIGINS,
@@ -20,6 +36,7 @@ app.add_middleware(
 
 # Add Routes
 app.include_router(summarizer_router, prefix="/summarizer")
+app.include_router(auth_router, prefix="/auth")
 
 # Add Global Exception Handlers
 register_exception_handlers(app)
@@ -1,3 +1,3 @@
-from middlewares.auth import AuthMiddleware
-from middlewares.db_connection import DBSessionMiddleware
+from middlewares.request_context import RequestContextMiddleware, LazySession
+from middlewares.admission import AdmissionControlMiddleware
 from fastapi.middleware.cors import CORSMiddleware
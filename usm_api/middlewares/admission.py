@@ -0,0 +1,68 @@
+import math
+from typing import List, Optional
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+from models import validator_models
+from config import Config
+from utility import logger
+from utility.rate_limit import TokenBucket, TokenBucketStore, get_token_bucket_store
+
+
+class AdmissionControlMiddleware:
+    """
+    Pure ASGI middleware that rate limits authenticated callers.
+
+    It runs inside RequestContextMiddleware so the user and their plan are
+    known. Every request takes a token from the user's bucket and from the
+    bucket shared by their plan; requests over budget get a 429 with
+    Retry-After before they reach a handler or check out a DB connection.
+    """
+
+    def __init__(self, app: ASGIApp, store: Optional[TokenBucketStore] = None):
+        self.app = app
+        self.store = store or get_token_bucket_store(Config.ADMISSION_STORE)
+
+    @staticmethod
+    def bucket(key: str, limit: dict) -> TokenBucket:
+        return TokenBucket(key, limit["burst"], limit["per_minute"] / 60)
+
+    def buckets(self, user: validator_models.AuthenticatedUser) -> List[TokenBucket]:
+        user_limit = Config.ADMISSION_USER_LIMITS.get(
+            user.plan, Config.ADMISSION_DEFAULT_USER_LIMIT
+        )
+        buckets = [self.bucket(f"admission:user:{user.id}", user_limit)]
+
+        plan_limit = Config.ADMISSION_PLAN_LIMITS.get(user.plan)
+        if plan_limit:
+            buckets.append(self.bucket(f"admission:plan:{user.plan}", plan_limit))
+        return buckets
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        user = scope.get("state", {}).get("user")
+        if scope["type"] != "http" or user is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            retry_after = await self.store.aconsume(self.buckets(user))
+        except Exception as e:
+            # Fail open, an unavailable store must not take the API down
+            logger.warning(f"Error in admission control for user {user.id} : {e}")
+            retry_after = 0
+
+        if retry_after:
+            logger.warning(f"Rate limit exceeded for user {user.id} on {scope['path']}")
+            error_response = validator_models.ErrorResponse(
+                error="Too many requests",
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            )
+            response = JSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content=error_response.model_dump(),
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
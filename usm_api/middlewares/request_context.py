@@ -0,0 +1,165 @@
+import jwt
+from typing import List, Optional
+from fastapi import status
+from fastapi.responses import JSONResponse
+from jwt import PyJWTError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+from models import validator_models
+from config import Config
+from utility import database_helper
+from utility.auth import TokenRevocationRegistry, claims_to_user, load_user
+
+
+class LazySession:
+    """Request scoped AsyncSession that is only created when a handler uses it"""
+
+    def __init__(self, session_maker: async_sessionmaker):
+        self.session_maker = session_maker
+        self._session: Optional[AsyncSession] = None
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self.session_maker()
+        return self._session
+
+    @property
+    def is_open(self) -> bool:
+        return self._session is not None
+
+    async def rollback(self) -> None:
+        if self._session is not None:
+            await self._session.rollback()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class RequestContextMiddleware:
+    """
+    Pure ASGI middleware that authenticates the caller and scopes the
+    database session of a request.
+
+    ``request.state.db`` holds a LazySession, so requests that never touch the
+    database never check out a connection. The session is rolled back on
+    errors and always closed once the response has been sent.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        algorithms: Optional[List[str]] = None,
+        excluded_paths: Optional[List[str]] = None,
+    ):
+        self.app = app
+        self.secret_key = Config.SECRET_KEY
+        self.session_maker = database_helper.AsyncSessionLocal
+        self.revocation = TokenRevocationRegistry()
+        self.algorithms = algorithms or ["HS256"]
+        self.excluded_paths = excluded_paths or [
+            "/docs",
+            "/openapi.json",
+            "/redoc",
+            "/health",
+            "/auth/login",
+            "/auth/refresh",
+        ]
+
+    @staticmethod
+    def error_response(
+        error: str, status_code: int, invalid_token: bool = True
+    ) -> JSONResponse:
+        error_response = validator_models.ErrorResponse(
+            error=error, status_code=status_code
+        )
+        headers = None
+        if invalid_token:
+            headers = {"WWW-Authenticate": 'Bearer error="invalid_token"'}
+        return JSONResponse(
+            status_code=status_code,
+            content=error_response.model_dump(),
+            headers=headers,
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        db = LazySession(self.session_maker)
+        state = scope.setdefault("state", {})
+        state["db"] = db
+        state["user"] = None
+
+        try:
+            # Skip authentication for excluded paths
+            if not any(scope["path"].startswith(p) for p in self.excluded_paths):
+                error_response = await self.authenticate(scope, db)
+                if error_response is not None:
+                    await error_response(scope, receive, send)
+                    return
+
+            await self.app(scope, receive, send)
+        except Exception:
+            # On exception, rollback the transaction to avoid partial state
+            await db.rollback()
+            raise
+        finally:
+            await db.close()
+
+    async def authenticate(self, scope: Scope, db: LazySession):
+        """Attach the user to the request state or return an error response"""
+        auth_header = Headers(scope=scope).get("Authorization")
+        if not auth_header or not auth_header.startswith("Bearer "):
+            return self.error_response(
+                "Invalid Authorization header",
+                status.HTTP_401_UNAUTHORIZED,
+                invalid_token=False,
+            )
+
+        token = auth_header.split(" ", 1)[1].strip()
+        try:
+            payload = jwt.decode(token, self.secret_key, algorithms=self.algorithms)
+        except jwt.ExpiredSignatureError:
+            return self.error_response(
+                "Token has expired", status.HTTP_401_UNAUTHORIZED
+            )
+        except PyJWTError:
+            return self.error_response("Invalid token", status.HTTP_401_UNAUTHORIZED)
+
+        # Identify user id in token payload (simplejwt uses "user_id")
+        user_identifier = payload.get("user_id")
+        if user_identifier is None:
+            return self.error_response(
+                "Token payload does not contain user identifier",
+                status.HTTP_401_UNAUTHORIZED,
+            )
+
+        # Trust the embedded claims, checking only for revoked token versions
+        user = claims_to_user(payload)
+        if user is None:
+            # Tokens issued without claims are resolved from the database
+            user = await self.load_user(db, int(user_identifier))
+            if not user:
+                return self.error_response(
+                    "User not found", status.HTTP_401_UNAUTHORIZED
+                )
+        elif await self.revocation.is_revoked(user.id, user.token_version):
+            return self.error_response(
+                "Token has been revoked", status.HTTP_401_UNAUTHORIZED
+            )
+
+        if not getattr(user, "is_active", True):
+            return self.error_response(
+                "User is inactive", status.HTTP_403_FORBIDDEN, invalid_token=False
+            )
+
+        scope["state"]["user"] = user
+        return None
+
+    async def load_user(self, db: LazySession, user_id: int):
+        return await load_user(db.session, user_id)
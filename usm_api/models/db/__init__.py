@@ -1,2 +1,2 @@
 from models.db.user import User
-from models.db.summarizer import Summary
+from models.db.summarizer import Summary, SummaryStatus
@@ -1,23 +1,105 @@
+from enum import Enum
 from pytz import timezone
 from config import Config
 from typing import Optional
 from datetime import datetime
 from sqlmodel import SQLModel, Field, Relationship
-from sqlalchemy import Column, Text, Boolean, DateTime, func
+from sqlalchemy import (
+    Column,
+    Text,
+    Boolean,
+    Integer,
+    DateTime,
+    String,
+    JSON,
+    Index,
+    func,
+)
 from models.db.user import User
 
 _TZ = timezone(Config.TIMEZONE)
 
 
+class SummaryStatus(str, Enum):
+    QUEUED = "queued"
+    FETCHING = "fetching"
+    EXTRACTING = "extracting"
+    SUMMARIZING = "summarizing"
+    DONE = "done"
+    FAILED = "failed"
+
+
 class Summary(SQLModel, table=True):
     __tablename__ = "summaries"
+    __table_args__ = (
+        # Covers the per-user listing ordered by (updated_at, id)
+        Index("ix_summaries_user_listing", "user_id", "is_deleted", "updated_at", "id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     url: str = Field(..., max_length=2048, index=True)
     user_id: int = Field(..., foreign_key="usm_user_user.id", index=True)
     summary: Optional[str] = Field(default=None, sa_column=Column(Text))
     processed: bool = Field(default=False, sa_column=Column(Boolean, nullable=False))
+    status: str = Field(
+        default=SummaryStatus.QUEUED.value,
+        sa_column=Column(
+            String(16),
+            server_default=SummaryStatus.QUEUED.value,
+            nullable=False,
+            index=True,
+        ),
+    )
+    # Summarization backend, see summarization_tools.backends
+    backend: str = Field(
+        default="llm",
+        sa_column=Column(String(16), server_default="llm", nullable=False),
+    )
+    # Leader the row was attached to as a single-flight follower, see
+    # InFlightRegistry. Cleared once the row is requeued on its own
+    flight_leader_id: Optional[int] = Field(
+        default=None, sa_column=Column(Integer, nullable=True, index=True)
+    )
+    # Fair queue class of the owner's plan, requeued work goes back to it
+    queue_class: str = Field(
+        default=Config.DEFAULT_QUEUE_CLASS,
+        sa_column=Column(
+            String(32), server_default=Config.DEFAULT_QUEUE_CLASS, nullable=False
+        ),
+    )
+    # Seconds spent in each phase of generate_summary, plus the total
+    phase_timings: Optional[dict] = Field(
+        default=None, sa_column=Column(JSON, nullable=True)
+    )
     is_deleted: bool = Field(default=False, sa_column=Column(Boolean, nullable=False))
+    # Worker currently processing the row, the claim lapses at lease_expires_at
+    lease_owner: Optional[str] = Field(
+        default=None, sa_column=Column(String(128), nullable=True)
+    )
+    lease_expires_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime, nullable=True, index=True)
+    )
+    # Validators of the page the summary was made from, for conditional GETs
+    etag: Optional[str] = Field(
+        default=None, sa_column=Column(String(512), nullable=True)
+    )
+    last_modified: Optional[str] = Field(
+        default=None, sa_column=Column(String(64), nullable=True)
+    )
+    # SHA-256 of the extracted page text, unchanged text skips the LLM
+    content_digest: Optional[str] = Field(
+        default=None, sa_column=Column(String(64), nullable=True)
+    )
+    # Minutes between refresh checks of a watched summary, None when unwatched
+    watch_interval: Optional[int] = Field(
+        default=None, sa_column=Column(Integer, nullable=True)
+    )
+    last_checked_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime, nullable=True)
+    )
+    next_check_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime, nullable=True, index=True)
+    )
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(_TZ),
         sa_column=Column(
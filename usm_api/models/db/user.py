@@ -43,6 +43,7 @@ class User(SQLModel, table=True):
     is_active: bool = Field(default=True, nullable=False)
     is_staff: bool = Field(default=False, nullable=False)
     is_superuser: bool = Field(default=False, nullable=False)
+    token_version: int = Field(default=0, nullable=False)
 
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
@@ -1,3 +1,23 @@
 from models.validators.exceptions import ErrorResponse
-from models.validators.request import SummarizerRequest, Pagination
-from models.validators.response import SummaryResponse, GetSummariesResponse
+from models.validators.request import (
+    SummarizerRequest,
+    BatchSummarizerRequest,
+    SummaryRefreshRequest,
+    Pagination,
+)
+from models.validators.response import (
+    SummaryResponse,
+    SummaryListItem,
+    GetSummariesResponse,
+    BatchSummaryResult,
+    BatchSummarizerResponse,
+    QueueStats,
+    QueueStatsResponse,
+    PhaseLatency,
+    PhaseStatsResponse,
+)
+from models.validators.auth import (
+    AuthenticatedUser,
+    RefreshTokenRequest,
+    TokenResponse,
+)
@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+
+
+class AuthenticatedUser(BaseModel):
+    id: int
+    is_active: bool = True
+    is_staff: bool = False
+    plan: str | None = None
+    token_version: int = 0
+
+
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str
+
+
+class TokenResponse(BaseModel):
+    access_token: str
+    token_type: str = "Bearer"
+    expires_in: int
@@ -1,9 +1,12 @@
 from pydantic import BaseModel, field_validator
+from config import Config
 from urllib.parse import urlparse
 
 
 class SummarizerRequest(BaseModel):
     url: str
+    # Summarization backend, the plan's default when not given
+    backend: str | None = None
 
     @field_validator("url")
     @classmethod
@@ -17,9 +20,39 @@ class SummarizerRequest(BaseModel):
         return v
 
 
+class BatchSummarizerRequest(BaseModel):
+    urls: list[str]
+    backend: str | None = None
+
+    @field_validator("urls")
+    @classmethod
+    def validate_urls(cls, v: list[str]) -> list[str]:
+        if not v:
+            raise ValueError("urls must contain at least one URL")
+        return v
+
+
+class SummaryRefreshRequest(BaseModel):
+    # None leaves the watch setting as it is
+    watch: bool | None = None
+    interval_minutes: int | None = None
+
+    @field_validator("interval_minutes")
+    @classmethod
+    def validate_interval_minutes(cls, v: int | None) -> int | None:
+        if v is not None and v < Config.REFRESH_MIN_INTERVAL_MINUTES:
+            raise ValueError(
+                f"interval_minutes needs to be at least "
+                f"{Config.REFRESH_MIN_INTERVAL_MINUTES}"
+            )
+        return v
+
+
 class Pagination(BaseModel):
     page: int = 1
     offset: int = 10
+    cursor: str | None = None
+    preview: bool = True
 
     @field_validator("offset")
     def validate_offset(cls, v: int) -> int:
@@ -9,6 +9,36 @@ class SummaryResponse(BaseModel):
     url: str
     summary: str | None
     processed: int | None
+    status: str
+    backend: str = "llm"
+    phase_timings: dict | None = None
+    watch_interval: int | None = None
+    last_checked_at: datetime | str | None = None
+    created_at: datetime | str
+    updated_at: datetime | str
+
+    class Config:
+        from_attributes = True
+
+    @field_validator("created_at")
+    def validate_created_at(v: datetime):
+        return v.strftime("%Y-%m-%d %H:%M:%S")
+
+    @field_validator("updated_at")
+    def validate_updated_at(v: datetime):
+        return v.strftime("%Y-%m-%d %H:%M:%S")
+
+    @field_validator("last_checked_at")
+    def validate_last_checked_at(v: datetime | None):
+        return v.strftime("%Y-%m-%d %H:%M:%S") if v else None
+
+
+class SummaryListItem(BaseModel):
+    id: int
+    url: str
+    status: str
+    processed: int | None
+    preview: str | None = None
     created_at: datetime | str
     updated_at: datetime | str
 
@@ -27,5 +57,47 @@ class SummaryResponse(BaseModel):
 class GetSummariesResponse(BaseModel):
     page: int
     offset: int
-    summaries: list[SummaryResponse]
+    summaries: list[SummaryListItem]
     user_id: int
+    next_cursor: str | None = None
+
+
+class BatchSummaryResult(BaseModel):
+    id: int | None = None
+    error: str | None = None
+
+
+class BatchSummarizerResponse(BaseModel):
+    msg: str
+    results: dict[str, BatchSummaryResult]
+
+
+class QueueStats(BaseModel):
+    queue_class: str
+    queue: str
+    pending: int
+    users: int
+    dispatched: int | None
+    wait_samples: int
+    wait_p50: float | None
+    wait_p95: float | None
+    wait_p99: float | None
+
+
+class QueueStatsResponse(BaseModel):
+    queues: list[QueueStats]
+
+
+class PhaseLatency(BaseModel):
+    phase: str
+    samples: int
+    p50: float | None
+    p95: float | None
+    p99: float | None
+
+
+class PhaseStatsResponse(BaseModel):
+    window_minutes: int
+    status_counts: dict[str, int]
+    stuck: int
+    phases: list[PhaseLatency]
@@ -1 +1,2 @@
 from routes.summarizer import summarizer_router
+from routes.auth import auth_router
@@ -0,0 +1 @@
+from routes.auth.handlers import router as auth_router
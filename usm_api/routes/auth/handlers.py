@@ -0,0 +1,53 @@
+import jwt
+from jwt import PyJWTError
+from fastapi import APIRouter, status
+from fastapi.requests import Request
+from fastapi.responses import JSONResponse
+from config import Config
+from models import validator_models
+from utility import logger
+from utility.auth import access_token_lifetime, issue_access_token, load_user
+
+router = APIRouter(tags=["auth"])
+
+
+def auth_error(error: str, status_code: int = status.HTTP_401_UNAUTHORIZED):
+    error_response = validator_models.ErrorResponse(
+        error=error, status_code=status_code
+    )
+    return JSONResponse(status_code=status_code, content=error_response.model_dump())
+
+
+@router.post("/refresh")
+async def refresh_access_token(
+    request: Request, request_body: validator_models.RefreshTokenRequest
+):
+    try:
+        payload = jwt.decode(
+            request_body.refresh_token, Config.SECRET_KEY, algorithms=["HS256"]
+        )
+    except jwt.ExpiredSignatureError:
+        return auth_error("Refresh token has expired")
+    except PyJWTError:
+        return auth_error("Invalid refresh token")
+
+    if payload.get("token_type") != "refresh" or payload.get("user_id") is None:
+        return auth_error("Invalid refresh token")
+
+    # Refresh is the one place claims are re-read from the database
+    user = await load_user(request.state.db.session, int(payload["user_id"]))
+    if user is None:
+        return auth_error("User not found")
+
+    if not user.is_active:
+        return auth_error("User is inactive", status.HTTP_403_FORBIDDEN)
+
+    if payload.get("token_version", 0) != user.token_version:
+        logger.info(f"Rejected revoked refresh token for user {user.id}")
+        return auth_error("Refresh token has been revoked")
+
+    response = validator_models.TokenResponse(
+        access_token=issue_access_token(user),
+        expires_in=int(access_token_lifetime().total_seconds()),
+    )
+    return JSONResponse(status_code=status.HTTP_200_OK, content=response.model_dump())
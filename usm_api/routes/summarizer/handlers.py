@@ -1,18 +1,114 @@
-from fastapi.responses import Response, JSONResponse
+import json
+import asyncio
+from fastapi.responses import Response, JSONResponse, StreamingResponse
 from fastapi import status
 from fastapi.requests import Request
 from fastapi import APIRouter, Depends
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from sqlalchemy import select, update, or_, and_, func, literal
+from config import Config
 from models import validator_models, db_models
 from utility import logger
 from utility import Helper
-from async_tasks import generate_summary
-from datetime import datetime
+from async_tasks import (
+    queue_class_for_plan,
+    enqueue_summaries,
+    enqueue_refreshes,
+    broker_queue_depth,
+)
+from utility.cache import InFlightRegistry
+from utility.storage import get_page_store
+from utility.events import event_hub, PartialSummaryStore
+from utility import database_helper
+from utility.queueing import get_fair_queue
+from summarization_tools import SUMMARY_BACKENDS
+from datetime import datetime, timedelta
 
 router = APIRouter(tags=["summarizer"])
+inflight_registry = InFlightRegistry()
+partial_summary_store = PartialSummaryStore()
+
+
+def resolve_backend(
+    user: validator_models.AuthenticatedUser, requested: str | None
+) -> str | None:
+    """Backend for a request, None when the user's plan does not offer it"""
+    allowed = Config.PLAN_SUMMARY_BACKENDS.get(
+        user.plan, Config.DEFAULT_SUMMARY_BACKENDS
+    )
+    if requested is None:
+        return allowed[0]
+    if requested in allowed and requested in SUMMARY_BACKENDS:
+        return requested
+    return None
+
+
+def dispatch_summarizations(
+    user: validator_models.AuthenticatedUser,
+    requests: list[tuple[str, int, str | None]],
+    backend: str,
+) -> dict[int, int]:
+    """Queue the leaders and return the leader id of every attached follower"""
+    # Join every row to its flight, only the leaders are queued for the workers.
+    # The dispatch beat task moves them on to the broker, off the request path
+    queue_class = queue_class_for_plan(user.plan)
+    leaders, followers = [], {}
+    for url, summary_id, page_digest in requests:
+        if not SUMMARY_BACKENDS[backend].shareable:
+            leaders.append((summary_id, page_digest))
+            continue
+        leader_id = inflight_registry.join(url, summary_id)
+        if leader_id is None:
+            leaders.append((summary_id, page_digest))
+            inflight_registry.promote(url, queue_class)
+            continue
+
+        logger.info(
+            f"Summarization request {summary_id} attached to in-flight id {leader_id}"
+        )
+        followers[summary_id] = leader_id
+        # Queue the leader in this row's class too when it ranks higher,
+        # whichever entry runs second finds the row claimed or processed
+        if inflight_registry.promote(url, queue_class):
+            leaders.append((leader_id, page_digest))
+            logger.info(f"Promoted in-flight id {leader_id} to {queue_class} class")
+
+    if leaders:
+        enqueue_summaries(user.id, queue_class, leaders)
+    return followers
+
+
+async def mark_followers(session, followers: dict[int, int]) -> None:
+    # Lets reclaim_expired_leases find followers whose flight expired
+    if not followers:
+        return
+    try:
+        for follower_id, leader_id in followers.items():
+            await session.execute(
+                update(db_models.Summary)
+                .where(db_models.Summary.id == follower_id)
+                .values(flight_leader_id=leader_id)
+            )
+        await session.commit()
+    except Exception as e:
+        logger.error(f"Error in marking followers {list(followers)} : {e}")
+        await session.rollback()
+
+
+async def store_fetched_page(url: str, page) -> str | None:
+    # Keep the fetched page so the worker does not download it again
+    if page.truncated:
+        return None
+    try:
+        return await run_in_threadpool(get_page_store().put, page)
+    except Exception as e:
+        logger.error(f"Error in storing fetched page for {url} : {e}")
+        return None
 
 
 @router.post("/summarize")
-def summarize(request: Request, request_body: validator_models.SummarizerRequest):
+async def summarize(request: Request, request_body: validator_models.SummarizerRequest):
     if not request.state.user:
         logger.error("Unauthorized access attempt to /summarize")
         error_response = validator_models.ErrorResponse(
@@ -24,7 +120,19 @@ def summarize(request: Request, request_body: validator_models.SummarizerRequest
             content=error_response.model_dump(),
         )
 
-    if not Helper.is_webpage(request_body.url):
+    backend = resolve_backend(request.state.user, request_body.backend)
+    if backend is None:
+        error_response = validator_models.ErrorResponse(
+            error=f"Summary backend {request_body.backend} is not available",
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content=error_response.model_dump(),
+        )
+
+    validation = await Helper.is_webpage_with_content(request_body.url, timeout=5)
+    if not (validation["is_webpage"] and validation["has_content"]):
         logger.error("Invalid URL provided for summarization")
         error_response = validator_models.ErrorResponse(
             error="Invalid URL provided for summarization",
@@ -35,53 +143,223 @@ def summarize(request: Request, request_body: validator_models.SummarizerRequest
             content=error_response.model_dump(),
         )
 
+    page_digest = await store_fetched_page(request_body.url, validation["page"])
+
     # Make Summarization Object
     user_id = request.state.user.id
-    with request.state.db() as session:
-        id = (
-            session.query(db_models.Summary)
-            .filter(
+    session = request.state.db.session
+    existing_summary = (
+        await session.execute(
+            select(db_models.Summary)
+            .where(
                 db_models.Summary.url == request_body.url,
                 db_models.Summary.user_id == user_id,
                 db_models.Summary.is_deleted == False,
                 db_models.Summary.processed == True,
             )
-            .first()
+            .limit(1)
         )
+    ).first()
 
-        if id:
-            logger.error(f"Summarization request for existing URL by user {user_id}")
+    if existing_summary:
+        logger.error(f"Summarization request for existing URL by user {user_id}")
+        error_response = validator_models.ErrorResponse(
+            error="Summarization for this URL already exists",
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+        return JSONResponse(
+            status_code=status.HTTP_403_FORBIDDEN,
+            content=error_response.model_dump(),
+        )
+
+    summarization = db_models.Summary(
+        url=request_body.url,
+        user_id=user_id,
+        processed=False,
+        backend=backend,
+        queue_class=queue_class_for_plan(request.state.user.plan),
+        **validation["page"].validators,
+    )
+    session.add(summarization)
+    await session.commit()
+    await session.refresh(summarization)
+    logger.info(
+        f"Created summarization request with id {summarization.id} for user id {user_id}"
+    )
+
+    followers = await run_in_threadpool(
+        dispatch_summarizations,
+        request.state.user,
+        [(request_body.url, summarization.id, page_digest)],
+        backend,
+    )
+    await mark_followers(session, followers)
+
+    # Return Generic Response
+    return JSONResponse(
+        status_code=status.HTTP_201_CREATED,
+        content={"msg": "Summarization in progress", "id": summarization.id},
+    )
+
+
+@router.post("/summarize/batch")
+async def summarize_batch(
+    request: Request, request_body: validator_models.BatchSummarizerRequest
+):
+    if not request.state.user:
+        logger.error("Unauthorized access attempt to /summarize/batch")
+        error_response = validator_models.ErrorResponse(
+            error="User is not authenticated",
+            status_code=status.HTTP_403_FORBIDDEN,
+        )
+        return JSONResponse(
+            status_code=status.HTTP_403_FORBIDDEN,
+            content=error_response.model_dump(),
+        )
+
+    user_id = request.state.user.id
+    batch_limit = Config.BATCH_SUMMARIZE_LIMITS.get(
+        request.state.user.plan, Config.BATCH_SUMMARIZE_DEFAULT_LIMIT
+    )
+    submitted_urls = list(dict.fromkeys(request_body.urls))
+    if len(submitted_urls) > batch_limit:
+        logger.error(f"Batch of {len(submitted_urls)} URLs exceeds limit for {user_id}")
+        error_response = validator_models.ErrorResponse(
+            error=f"Batch can contain at most {batch_limit} URLs",
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content=error_response.model_dump(),
+        )
+
+    backend = resolve_backend(request.state.user, request_body.backend)
+    if backend is None:
+        error_response = validator_models.ErrorResponse(
+            error=f"Summary backend {request_body.backend} is not available",
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content=error_response.model_dump(),
+        )
+
+    results: dict[str, validator_models.BatchSummaryResult] = {}
+    page_validators: dict[str, dict] = {}
+    semaphore = asyncio.Semaphore(Config.BATCH_VALIDATION_CONCURRENCY)
+
+    async def validate(submitted_url: str) -> tuple[str, str, str | None] | None:
+        try:
+            url = validator_models.SummarizerRequest(url=submitted_url).url
+        except ValidationError:
+            results[submitted_url] = validator_models.BatchSummaryResult(
+                error="URL must be a valid HTTP or HTTPS URL"
+            )
+            return None
+
+        async with semaphore:
+            validation = await Helper.is_webpage_with_content(url, timeout=5)
+        if not (validation["is_webpage"] and validation["has_content"]):
+            results[submitted_url] = validator_models.BatchSummaryResult(
+                error="Invalid URL provided for summarization"
+            )
+            return None
+
+        page_digest = await store_fetched_page(url, validation["page"])
+        page_validators[url] = validation["page"].validators
+        return submitted_url, url, page_digest
+
+    validated = [
+        item
+        for item in await asyncio.gather(*map(validate, submitted_urls))
+        if item is not None
+    ]
+
+    session = request.state.db.session
+    if validated:
+        # One set based duplicate check for the whole batch
+        existing_urls = set(
+            (
+                await session.execute(
+                    select(db_models.Summary.url).where(
+                        db_models.Summary.url.in_([url for _, url, _ in validated]),
+                        db_models.Summary.user_id == user_id,
+                        db_models.Summary.is_deleted == False,
+                        db_models.Summary.processed == True,
+                    )
+                )
+            )
+            .scalars()
+            .all()
+        )
+        for submitted_url, url, _ in validated:
+            if url in existing_urls:
+                results[submitted_url] = validator_models.BatchSummaryResult(
+                    error="Summarization for this URL already exists"
+                )
+        validated = [item for item in validated if item[1] not in existing_urls]
+
+    summarizations = [
+        db_models.Summary(
+            url=url,
+            user_id=user_id,
+            processed=False,
+            backend=backend,
+            queue_class=queue_class_for_plan(request.state.user.plan),
+            **page_validators[url],
+        )
+        for _, url, _ in validated
+    ]
+    if summarizations:
+        try:
+            session.add_all(summarizations)
+            await session.commit()
+        except Exception as e:
+            logger.error(f"Error in creating batch summarizations for {user_id} : {e}")
+            await session.rollback()
             error_response = validator_models.ErrorResponse(
-                error="Summarization for this URL already exists",
-                status_code=status.HTTP_400_BAD_REQUEST,
+                error="Error in creating summarization requests",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
             return JSONResponse(
-                status_code=status.HTTP_403_FORBIDDEN,
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 content=error_response.model_dump(),
             )
-
-        summarization = db_models.Summary(
-            url=request_body.url, user_id=user_id, processed=False
-        )
-        session.add(summarization)
-        session.commit()
-        session.refresh(summarization)
         logger.info(
-            f"Created summarization request with id {summarization.id} for user id {user_id}"
+            f"Created {len(summarizations)} summarization requests for user id {user_id}"
         )
 
-    # Make URL Summarization Request
-    generate_summary.apply_async(args=[summarization.id], queue="summarization_queue")
+        followers = await run_in_threadpool(
+            dispatch_summarizations,
+            request.state.user,
+            [
+                (url, summarization.id, page_digest)
+                for (_, url, page_digest), summarization in zip(
+                    validated, summarizations
+                )
+            ],
+            backend,
+        )
+        await mark_followers(session, followers)
 
-    # Return Generic Response
+    for (submitted_url, _, _), summarization in zip(validated, summarizations):
+        results[submitted_url] = validator_models.BatchSummaryResult(
+            id=summarization.id
+        )
+
+    response = validator_models.BatchSummarizerResponse(
+        msg=f"{len(summarizations)} of {len(submitted_urls)} summarizations in progress",
+        results={url: results[url] for url in submitted_urls},
+    )
     return JSONResponse(
-        status_code=status.HTTP_201_CREATED,
-        content={"msg": "Summarization in progress", "id": summarization.id},
+        status_code=status.HTTP_201_CREATED, content=response.model_dump()
     )
 
 
 @router.get("/list")
-def get_summary(request: Request, pagination: validator_models.Pagination = Depends()):
+async def get_summary(
+    request: Request, pagination: validator_models.Pagination = Depends()
+):
     if not request.state.user:
         logger.error("Unauthorized access attempt to /summarize")
         error_response = validator_models.ErrorResponse(
@@ -96,22 +374,64 @@ def get_summary(request: Request, pagination: validator_models.Pagination = Depe
     user_id = request.state.user.id
     page = pagination.page
     offset = pagination.offset
+    seek = None
+    if pagination.cursor:
+        try:
+            seek = Helper.decode_cursor(pagination.cursor)
+        except ValueError as e:
+            logger.error(f"Invalid pagination cursor from user_id {user_id}")
+            error_response = validator_models.ErrorResponse(
+                error=str(e),
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+            return JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content=error_response.model_dump(),
+            )
 
-    try:
-        with request.state.db() as session:
-            extracted_summary = (
-                session.query(db_models.Summary)
-                .filter(
-                    db_models.Summary.user_id == user_id,
-                    db_models.Summary.is_deleted == False,
-                )
-                .order_by(-db_models.Summary.updated_at)
-                .offset((page - 1) * offset)
-                .limit(offset)
-                .all()
+    # Project only what the listing shows, the full text is served by /{id}
+    preview = literal(None).label("preview")
+    if pagination.preview:
+        preview = func.substr(
+            db_models.Summary.summary, 1, Config.SUMMARY_PREVIEW_LENGTH
+        ).label("preview")
+
+    query = (
+        select(
+            db_models.Summary.id,
+            db_models.Summary.url,
+            db_models.Summary.processed,
+            db_models.Summary.status,
+            preview,
+            db_models.Summary.created_at,
+            db_models.Summary.updated_at,
+        )
+        .where(
+            db_models.Summary.user_id == user_id,
+            db_models.Summary.is_deleted == False,
+        )
+        .order_by(db_models.Summary.updated_at.desc(), db_models.Summary.id.desc())
+        .limit(offset + 1)
+    )
+    if seek is not None:
+        # Keyset pagination, seeks past the last row of the previous page
+        updated_at, last_id = seek
+        query = query.where(
+            or_(
+                db_models.Summary.updated_at < updated_at,
+                and_(
+                    db_models.Summary.updated_at == updated_at,
+                    db_models.Summary.id < last_id,
+                ),
             )
+        )
+    else:
+        # Page numbers are still supported for older clients
+        query = query.offset((page - 1) * offset)
 
-            extracted_summary = list(extracted_summary)
+    try:
+        session = request.state.db.session
+        extracted_summary = list((await session.execute(query)).all())
     except Exception as e:
         logger.error(f"Error in Extracting summaries for user_id {user_id} : {e}")
         error_response = validator_models.ErrorResponse(
@@ -123,15 +443,25 @@ def get_summary(request: Request, pagination: validator_models.Pagination = Depe
             content=error_response.model_dump(),
         )
 
+    next_cursor = None
+    if len(extracted_summary) > offset:
+        extracted_summary = extracted_summary[:offset]
+        last_summary = extracted_summary[-1]
+        next_cursor = Helper.encode_cursor(last_summary.updated_at, last_summary.id)
+
     response = validator_models.GetSummariesResponse(
-        page=page, offset=offset, user_id=user_id, summaries=extracted_summary
+        page=page,
+        offset=offset,
+        user_id=user_id,
+        summaries=extracted_summary,
+        next_cursor=next_cursor,
     )
 
     return JSONResponse(status_code=status.HTTP_200_OK, content=response.model_dump())
 
 
 @router.delete("/remove/{summary_id}")
-def remove_summary(request: Request, summary_id: int):
+async def remove_summary(request: Request, summary_id: int):
     if not request.state.user:
         logger.error("Unauthorized access attempt to /summarize")
         error_response = validator_models.ErrorResponse(
@@ -144,17 +474,19 @@ def remove_summary(request: Request, summary_id: int):
         )
 
     user_id = request.state.user.id
+    session = request.state.db.session
     try:
-        with request.state.db() as session:
-            extracted_summary = (
-                session.query(db_models.Summary)
-                .filter(
+        extracted_summary = (
+            await session.execute(
+                select(db_models.Summary)
+                .where(
                     db_models.Summary.user_id == user_id,
                     db_models.Summary.id == summary_id,
                     db_models.Summary.is_deleted == False,
                 )
-                .first()
+                .limit(1)
             )
+        ).scalar_one_or_none()
     except Exception as e:
         logger.error(f"Error in Extracting summaries for user_id {user_id} : {e}")
         error_response = validator_models.ErrorResponse(
@@ -178,19 +510,15 @@ def remove_summary(request: Request, summary_id: int):
 
     try:
         # Mark Summary as Deleted
-        with request.state.db() as session:
-            extracted_summary.is_deleted = True
-            extracted_summary.deleted_at = datetime.now()
-            session.add(extracted_summary)
-            session.commit()
-            session.refresh(extracted_summary)
-            logger.info(
-                f"Summary with id {summary_id} has been deleted by user {user_id}"
-            )
+        extracted_summary.is_deleted = True
+        extracted_summary.deleted_at = datetime.now()
+        session.add(extracted_summary)
+        await session.commit()
+        logger.info(f"Summary with id {summary_id} has been deleted by user {user_id}")
 
     except Exception as e:
         logger.error(f"Error in deleting summary with id {summary_id} : {e}")
-        session.rollback()
+        await session.rollback()
         error_response = validator_models.ErrorResponse(
             error=f"Error in summary deletion",
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -204,3 +532,499 @@ def remove_summary(request: Request, summary_id: int):
         status_code=status.HTTP_200_OK,
         content={"msg": f"Summary with id {summary_id} has been deleted"},
     )
+
+
+def sse_message(event: dict) -> str:
+    return f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+
+@router.get("/events")
+async def summary_events(request: Request):
+    if not request.state.user:
+        logger.error("Unauthorized access attempt to /summarizer/events")
+        error_response = validator_models.ErrorResponse(
+            error="User is not authenticated",
+            status_code=status.HTTP_403_FORBIDDEN,
+        )
+        return JSONResponse(
+            status_code=status.HTTP_403_FORBIDDEN,
+            content=error_response.model_dump(),
+        )
+
+    user_id = request.state.user.id
+    queue = event_hub.subscribe(user_id)
+
+    async def event_stream():
+        try:
+            yield ": connected\n\n"
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), timeout=Config.EVENT_STREAM_HEARTBEAT
+                    )
+                except asyncio.TimeoutError:
+                    # Keep idle connections open through proxies
+                    yield ": heartbeat\n\n"
+                    continue
+                yield sse_message(event)
+        finally:
+            event_hub.unsubscribe(user_id, queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def final_summary_event(summary_id: int) -> dict | None:
+    """The completed or failed event of a finished summary, None while running"""
+    async with database_helper.AsyncSessionLocal() as session:
+        row = (
+            await session.execute(
+                select(
+                    db_models.Summary.processed,
+                    db_models.Summary.status,
+                    db_models.Summary.summary,
+                ).where(db_models.Summary.id == summary_id)
+            )
+        ).first()
+    if row is None or row.status == db_models.SummaryStatus.FAILED.value:
+        return {"type": "summary.failed", "id": summary_id, "status": "failed"}
+    if row.processed:
+        return {
+            "type": "summary.completed",
+            "id": summary_id,
+            "status": "done",
+            "summary": row.summary,
+        }
+    return None
+
+
+@router.get("/{summary_id}/stream")
+async def summary_stream(request: Request, summary_id: int):
+    if not request.state.user:
+        logger.error("Unauthorized access attempt to /summarizer/{summary_id}/stream")
+        error_response = validator_models.ErrorResponse(
+            error="User is not authenticated",
+            status_code=status.HTTP_403_FORBIDDEN,
+        )
+        return JSONResponse(
+            status_code=status.HTTP_403_FORBIDDEN,
+            content=error_response.model_dump(),
+        )
+
+    user_id = request.state.user.id
+    session = request.state.db.session
+    try:
+        exists = (
+            await session.execute(
+                select(db_models.Summary.id)
+                .where(
+                    db_models.Summary.user_id == user_id,
+                    db_models.Summary.id == summary_id,
+                    db_models.Summary.is_deleted == False,
+                )
+                .limit(1)
+            )
+        ).scalar_one_or_none()
+        # Do not hold a connection for as long as the stream stays open
+        await session.commit()
+    except Exception as e:
+        logger.error(
+            f"Error in Extracting summary {summary_id} for user_id {user_id} : {e}"
+        )
+        error_response = validator_models.ErrorResponse(
+            error="Error in extracting summary",
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+        return JSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content=error_response.model_dump(),
+        )
+
+    if exists is None:
+        error_response = validator_models.ErrorResponse(
+            error=f"Summary does not exists with id {summary_id}",
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content=error_response.model_dump(),
+        )
+
+    queue = event_hub.subscribe(user_id)
+
+    async def event_stream():
+        try:
+            yield ": connected\n\n"
+            # Subscribed before looking, so a completion in between is not lost
+            final_event = await final_summary_event(summary_id)
+            if final_event is not None:
+                yield sse_message(final_event)
+                return
+
+            text = await run_in_threadpool(partial_summary_store.get, summary_id)
+            text = text or ""
+            yield sse_message(
+                {"type": "summary.partial", "id": summary_id, "offset": 0, "text": text}
+            )
+            sent = len(text)
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), timeout=Config.EVENT_STREAM_HEARTBEAT
+                    )
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+                    continue
+                if event.get("id") != summary_id:
+                    continue
+
+                if event["type"] == "summary.partial":
+                    # Generation started over, e.g. on a retry
+                    sent = len(event["text"])
+                    yield sse_message(event)
+                elif event["type"] == "summary.delta":
+                    offset, delta = event["offset"], event["text"]
+                    if offset > sent:
+                        # Deltas were dropped, resend from the stored text
+                        text = await run_in_threadpool(
+                            partial_summary_store.get, summary_id
+                        )
+                        text = text or ""
+                        sent = len(text)
+                        yield sse_message(
+                            {
+                                **event,
+                                "type": "summary.partial",
+                                "offset": 0,
+                                "text": text,
+                            }
+                        )
+                    elif offset + len(delta) > sent:
+                        delta = delta[sent - offset :]
+                        yield sse_message({**event, "offset": sent, "text": delta})
+                        sent += len(delta)
+                elif event["type"] in ("summary.completed", "summary.failed"):
+                    yield sse_message(await final_summary_event(summary_id) or event)
+                    return
+        finally:
+            event_hub.unsubscribe(user_id, queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/queues")
+async def queue_stats(request: Request):
+    if not request.state.user:
+        logger.error("Unauthorized access attempt to /summarizer/queues")
+        error_response = validator_models.ErrorResponse(
+            error="User is not authenticated",
+            status_code=status.HTTP_403_FORBIDDEN,
+        )
+        return JSONResponse(
+            status_code=status.HTTP_403_FORBIDDEN,
+            content=error_response.model_dump(),
+        )
+
+    if not request.state.user.is_staff:
+        logger.error(
+            f"Non staff user {request.state.user.id} requested /summarizer/queues"
+        )
+        error_response = validator_models.ErrorResponse(
+            error="Queue statistics are only available to staff",
+            status_code=status.HTTP_403_FORBIDDEN,
+        )
+        return JSONResponse(
+            status_code=status.HTTP_403_FORBIDDEN,
+            content=error_response.model_dump(),
+        )
+
+    def collect_stats() -> list[validator_models.QueueStats]:
+        fair_queue = get_fair_queue()
+        queues = []
+        for queue_class, queue in Config.SUMMARIZATION_QUEUES.items():
+            try:
+                dispatched = broker_queue_depth(queue)
+            except Exception as e:
+                logger.warning(f"Error in reading depth of queue {queue} : {e}")
+                dispatched = None
+            queues.append(
+                validator_models.QueueStats(
+                    queue_class=queue_class,
+                    queue=queue,
+                    dispatched=dispatched,
+                    **fair_queue.stats(queue_class),
+                )
+            )
+        return queues
+
+    response = validator_models.QueueStatsResponse(
+        queues=await run_in_threadpool(collect_stats)
+    )
+    return JSONResponse(status_code=status.HTTP_200_OK, content=response.model_dump())
+
+
+@router.get("/stats/phases")
+async def phase_stats(request: Request):
+    if not request.state.user:
+        logger.error("Unauthorized access attempt to /summarizer/stats/phases")
+        error_response = validator_models.ErrorResponse(
+            error="User is not authenticated",
+            status_code=status.HTTP_403_FORBIDDEN,
+        )
+        return JSONResponse(
+            status_code=status.HTTP_403_FORBIDDEN,
+            content=error_response.model_dump(),
+        )
+
+    now = datetime.now()
+    window_start = now - timedelta(minutes=Config.PHASE_STATS_WINDOW_MINUTES)
+    stuck_before = now - timedelta(minutes=Config.STUCK_SUMMARY_MINUTES)
+    terminal = [
+        db_models.SummaryStatus.DONE.value,
+        db_models.SummaryStatus.FAILED.value,
+    ]
+    # Staff see every user's summaries, everyone else only their own
+    scope = []
+    if not request.state.user.is_staff:
+        scope.append(db_models.Summary.user_id == request.state.user.id)
+    try:
+        session = request.state.db.session
+        status_counts = dict(
+            (
+                await session.execute(
+                    select(db_models.Summary.status, func.count())
+                    .where(db_models.Summary.updated_at >= window_start, *scope)
+                    .group_by(db_models.Summary.status)
+                )
+            ).all()
+        )
+        stuck = (
+            await session.execute(
+                select(func.count()).where(
+                    db_models.Summary.status.not_in(terminal),
+                    db_models.Summary.is_deleted == False,
+                    db_models.Summary.updated_at < stuck_before,
+                    *scope,
+                )
+            )
+        ).scalar_one()
+        phase_timings = (
+            (
+                await session.execute(
+                    select(db_models.Summary.phase_timings)
+                    .where(
+                        db_models.Summary.status.in_(terminal),
+                        db_models.Summary.updated_at >= window_start,
+                        db_models.Summary.phase_timings.is_not(None),
+                        *scope,
+                    )
+                    .order_by(db_models.Summary.updated_at.desc())
+                    .limit(Config.PHASE_STATS_MAX_SAMPLES)
+                )
+            )
+            .scalars()
+            .all()
+        )
+    except Exception as e:
+        logger.error(f"Error in extracting phase statistics : {e}")
+        error_response = validator_models.ErrorResponse(
+            error="Error in extracting phase statistics",
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+        return JSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content=error_response.model_dump(),
+        )
+
+    phases = []
+    for phase in ["queued", "fetching", "extracting", "summarizing", "total"]:
+        samples = [timings[phase] for timings in phase_timings if phase in timings]
+        phases.append(
+            validator_models.PhaseLatency(
+                phase=phase,
+                samples=len(samples),
+                p50=Helper.percentile(samples, 0.50),
+                p95=Helper.percentile(samples, 0.95),
+                p99=Helper.percentile(samples, 0.99),
+            )
+        )
+
+    response = validator_models.PhaseStatsResponse(
+        window_minutes=Config.PHASE_STATS_WINDOW_MINUTES,
+        status_counts=status_counts,
+        stuck=stuck,
+        phases=phases,
+    )
+    return JSONResponse(status_code=status.HTTP_200_OK, content=response.model_dump())
+
+
+@router.post("/{summary_id}/refresh")
+async def refresh_summary_now(
+    request: Request,
+    summary_id: int,
+    request_body: validator_models.SummaryRefreshRequest | None = None,
+):
+    if not request.state.user:
+        logger.error("Unauthorized access attempt to /summarizer/{summary_id}/refresh")
+        error_response = validator_models.ErrorResponse(
+            error="User is not authenticated",
+            status_code=status.HTTP_403_FORBIDDEN,
+        )
+        return JSONResponse(
+            status_code=status.HTTP_403_FORBIDDEN,
+            content=error_response.model_dump(),
+        )
+
+    user_id = request.state.user.id
+    session = request.state.db.session
+    request_body = request_body or validator_models.SummaryRefreshRequest()
+    try:
+        extracted_summary = (
+            await session.execute(
+                select(db_models.Summary)
+                .where(
+                    db_models.Summary.user_id == user_id,
+                    db_models.Summary.id == summary_id,
+                    db_models.Summary.is_deleted == False,
+                )
+                .limit(1)
+            )
+        ).scalar_one_or_none()
+    except Exception as e:
+        logger.error(
+            f"Error in Extracting summary {summary_id} for user_id {user_id} : {e}"
+        )
+        error_response = validator_models.ErrorResponse(
+            error="Error in extracting summary",
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+        return JSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content=error_response.model_dump(),
+        )
+
+    if extracted_summary is None:
+        error_response = validator_models.ErrorResponse(
+            error=f"Summary does not exists with id {summary_id}",
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content=error_response.model_dump(),
+        )
+
+    if not extracted_summary.processed:
+        error_response = validator_models.ErrorResponse(
+            error=f"Summary with id {summary_id} is still being generated",
+            status_code=status.HTTP_409_CONFLICT,
+        )
+        return JSONResponse(
+            status_code=status.HTTP_409_CONFLICT,
+            content=error_response.model_dump(),
+        )
+
+    if request_body.watch is not None or request_body.interval_minutes is not None:
+        watch = request_body.watch
+        if watch is None:
+            watch = True
+        watch_interval = (
+            request_body.interval_minutes
+            or extracted_summary.watch_interval
+            or Config.REFRESH_DEFAULT_INTERVAL_MINUTES
+        )
+        try:
+            extracted_summary.watch_interval = watch_interval if watch else None
+            extracted_summary.next_check_at = (
+                datetime.now() + timedelta(minutes=watch_interval) if watch else None
+            )
+            session.add(extracted_summary)
+            await session.commit()
+        except Exception as e:
+            logger.error(f"Error in updating watch of summary {summary_id} : {e}")
+            await session.rollback()
+            error_response = validator_models.ErrorResponse(
+                error="Error in updating summary watch",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+            return JSONResponse(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                content=error_response.model_dump(),
+            )
+
+    watch_interval = extracted_summary.watch_interval
+    # Takes its turn in the fair queue like any other summary of the user
+    await run_in_threadpool(
+        enqueue_refreshes, user_id, extracted_summary.queue_class, [summary_id]
+    )
+    logger.info(f"Refresh requested for summary id {summary_id} by user {user_id}")
+
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content={
+            "msg": "Refresh in progress",
+            "id": summary_id,
+            "watch_interval": watch_interval,
+        },
+    )
+
+
+@router.get("/{summary_id}")
+async def get_summary_detail(request: Request, summary_id: int):
+    if not request.state.user:
+        logger.error("Unauthorized access attempt to /summarizer/{summary_id}")
+        error_response = validator_models.ErrorResponse(
+            error="User is not authenticated",
+            status_code=status.HTTP_403_FORBIDDEN,
+        )
+        return JSONResponse(
+            status_code=status.HTTP_403_FORBIDDEN,
+            content=error_response.model_dump(),
+        )
+
+    user_id = request.state.user.id
+    try:
+        session = request.state.db.session
+        extracted_summary = (
+            await session.execute(
+                select(db_models.Summary)
+                .where(
+                    db_models.Summary.user_id == user_id,
+                    db_models.Summary.id == summary_id,
+                    db_models.Summary.is_deleted == False,
+                )
+                .limit(1)
+            )
+        ).scalar_one_or_none()
+    except Exception as e:
+        logger.error(
+            f"Error in Extracting summary {summary_id} for user_id {user_id} : {e}"
+        )
+        error_response = validator_models.ErrorResponse(
+            error="Error in extracting summary",
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+        return JSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content=error_response.model_dump(),
+        )
+
+    if extracted_summary is None:
+        error_response = validator_models.ErrorResponse(
+            error=f"Summary does not exists with id {summary_id}",
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content=error_response.model_dump(),
+        )
+
+    response = validator_models.SummaryResponse.model_validate(extracted_summary)
+    return JSONResponse(status_code=status.HTTP_200_OK, content=response.model_dump())
@@ -1 +1,9 @@
-from summarization_tools.tools import SummaryTool
+from summarization_tools.tools import BaseSummaryTool, SummaryTool, create_llm
+from summarization_tools.extractive import ExtractiveSummaryTool
+from summarization_tools.backends import (
+    SUMMARY_BACKENDS,
+    get_summary_tool,
+    provider_health,
+)
+from summarization_tools.rate_limit import LLMRateLimiter
+from summarization_tools.extraction import extract_main_content
@@ -0,0 +1,67 @@
+from typing import Callable, Optional
+from langchain_core.documents import Document
+from config import Config
+from utility import logger
+from utility.cache import CacheBackend, get_cache_backend
+from summarization_tools.tools import BaseSummaryTool, SummaryTool
+from summarization_tools.extractive import ExtractiveSummaryTool
+
+# Summarization backends by the name stored on Summary.backend
+SUMMARY_BACKENDS: dict[str, type[BaseSummaryTool]] = {
+    SummaryTool.name: SummaryTool,
+    ExtractiveSummaryTool.name: ExtractiveSummaryTool,
+}
+
+
+def get_summary_tool(
+    backend: str,
+    url: str,
+    page_digest: str | None = None,
+    llm=None,
+    on_phase: Callable[[str], None] | None = None,
+    documents: list[Document] | None = None,
+) -> BaseSummaryTool:
+    """Build a backend, only the ones calling a model are handed ``llm``"""
+    if backend not in SUMMARY_BACKENDS:
+        raise ValueError(f"Unknown summary backend {backend}")
+    tool = SUMMARY_BACKENDS[backend]
+    options = {"llm": llm} if issubclass(tool, SummaryTool) else {}
+    return tool(
+        url,
+        page_digest=page_digest,
+        on_phase=on_phase,
+        documents=documents,
+        **options,
+    )
+
+
+class ProviderHealth:
+    """
+    Backends whose generations recently failed for good.
+
+    A failure marks the backend degraded for ``cooldown`` seconds in the
+    shared cache, so every worker sends new rows to the fallback backend
+    instead of waiting on the provider first.
+    """
+
+    def __init__(
+        self, backend: Optional[CacheBackend] = None, cooldown: Optional[int] = None
+    ):
+        self.backend = backend or get_cache_backend("provider_health")
+        self.cooldown = cooldown or Config.LLM_DEGRADED_COOLDOWN
+
+    def mark_degraded(self, name: str) -> None:
+        try:
+            self.backend.set(name, 1, ttl=self.cooldown)
+        except Exception as e:
+            logger.warning(f"Error in marking backend {name} degraded : {e}")
+
+    def is_degraded(self, name: str) -> bool:
+        try:
+            return self.backend.get(name) is not None
+        except Exception as e:
+            logger.warning(f"Error in reading health of backend {name} : {e}")
+            return False
+
+
+provider_health = ProviderHealth()
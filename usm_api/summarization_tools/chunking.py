@@ -0,0 +1,63 @@
+import hashlib
+from typing import List
+from langchain_core.documents import Document
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+# Rough average for English prose, avoids a count_tokens call to the model API
+CHARS_PER_TOKEN = 4
+
+
+def approximate_token_count(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN
+
+
+def is_chunk_boundary(piece: str) -> bool:
+    # Roughly one piece in six ends a chunk, decided by its content alone
+    return int(hashlib.sha1(piece.encode("utf-8")).hexdigest()[:8], 16) % 6 == 0
+
+
+def split_documents(documents: List[Document], chunk_tokens: int) -> List[str]:
+    """
+    Split documents into chunks of roughly ``chunk_tokens`` for the map phase.
+
+    Chunk boundaries are content defined: once a chunk holds a third of its budget
+    it ends after any line that hashes to a boundary. An edit only changes the
+    chunk it falls in, where greedy packing would shift every chunk after it,
+    so the map outputs of unchanged chunks can be reused from the cache.
+    """
+    piece_splitter = RecursiveCharacterTextSplitter(
+        chunk_size=chunk_tokens * CHARS_PER_TOKEN // 4, chunk_overlap=0
+    )
+    chunks: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+    for document in documents:
+        for line in document.page_content.splitlines():
+            if not line.strip():
+                continue
+            for piece in piece_splitter.split_text(line):
+                current.append(piece)
+                current_tokens += approximate_token_count(piece)
+                if current_tokens >= chunk_tokens or (
+                    current_tokens >= chunk_tokens // 3 and is_chunk_boundary(piece)
+                ):
+                    chunks.append("\n".join(current))
+                    current, current_tokens = [], 0
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+def group_by_tokens(texts: List[str], token_max: int) -> List[List[str]]:
+    """Group consecutive texts so every group fits in ``token_max`` tokens"""
+    groups: List[List[str]] = []
+    group_tokens = 0
+    for text in texts:
+        tokens = approximate_token_count(text)
+        if groups and group_tokens + tokens <= token_max:
+            groups[-1].append(text)
+            group_tokens += tokens
+        else:
+            groups.append([text])
+            group_tokens = tokens
+    return groups
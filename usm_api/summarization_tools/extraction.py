@@ -0,0 +1,151 @@
+import re
+from bs4 import BeautifulSoup, Tag
+
+# Elements that never carry article text
+BOILERPLATE_TAGS = [
+    "script",
+    "style",
+    "noscript",
+    "template",
+    "iframe",
+    "svg",
+    "canvas",
+    "form",
+    "button",
+    "input",
+    "select",
+    "nav",
+    "header",
+    "footer",
+    "aside",
+]
+UNLIKELY_CANDIDATES = re.compile(
+    r"banner|breadcrumb|combx|comment|community|consent|cookie|disqus|extra|"
+    r"footer|gdpr|header|legends|menu|modal|nav|newsletter|pager|popup|promo|"
+    r"related|remark|replies|rss|share|shoutbox|sidebar|skyscraper|social|"
+    r"sponsor|subscribe|tags|tool|widget|advert|\bad-",
+    re.IGNORECASE,
+)
+MAYBE_CANDIDATE = re.compile(r"and|article|body|column|main|shadow", re.IGNORECASE)
+POSITIVE_WEIGHT = re.compile(
+    r"article|body|content|entry|hentry|main|page|post|story|text|blog",
+    re.IGNORECASE,
+)
+NEGATIVE_WEIGHT = re.compile(
+    r"comment|com-|contact|foot|footnote|masthead|media|meta|outbrain|promo|"
+    r"related|scroll|shoutbox|sidebar|sponsor|shopping|tags|tool|widget",
+    re.IGNORECASE,
+)
+PARAGRAPH_TAGS = ["p", "pre", "td", "blockquote", "li"]
+TAG_WEIGHTS = {
+    "article": 10,
+    "main": 10,
+    "section": 5,
+    "div": 5,
+    "pre": 3,
+    "td": 3,
+    "blockquote": 3,
+    "ol": -3,
+    "ul": -3,
+    "dl": -3,
+    "th": -5,
+}
+MIN_PARAGRAPH_LENGTH = 25
+MIN_ARTICLE_LENGTH = 250
+
+
+def normalize_whitespace(text: str) -> str:
+    lines = (" ".join(line.split()) for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def class_weight(element: Tag) -> int:
+    attributes = " ".join(element.get("class") or []) + " " + (element.get("id") or "")
+    weight = 0
+    if NEGATIVE_WEIGHT.search(attributes):
+        weight -= 25
+    if POSITIVE_WEIGHT.search(attributes):
+        weight += 25
+    return weight
+
+
+def link_density(element: Tag) -> float:
+    text_length = len(element.get_text(" ", strip=True))
+    if not text_length:
+        return 0.0
+    link_length = sum(
+        len(link.get_text(" ", strip=True)) for link in element.find_all("a")
+    )
+    return link_length / text_length
+
+
+def strip_boilerplate(soup: BeautifulSoup) -> None:
+    """Remove non content elements and unlikely candidates in place"""
+    for element in soup.find_all(BOILERPLATE_TAGS):
+        element.decompose()
+
+    unlikely = []
+    for element in soup.find_all(True):
+        if element.name in ("html", "body", "article", "main"):
+            continue
+        attributes = (
+            " ".join(element.get("class") or []) + " " + (element.get("id") or "")
+        )
+        if UNLIKELY_CANDIDATES.search(attributes) and not MAYBE_CANDIDATE.search(
+            attributes
+        ):
+            unlikely.append(element)
+    for element in unlikely:
+        if not element.decomposed:
+            element.decompose()
+
+
+def top_candidate(soup: BeautifulSoup) -> Tag | None:
+    """Score block elements by the paragraphs they hold, readability style"""
+    scores: dict[int, float] = {}
+    elements: dict[int, Tag] = {}
+
+    def add_score(element: Tag | None, score: float) -> None:
+        if not isinstance(element, Tag) or element.name in ("html", "[document]"):
+            return
+        key = id(element)
+        if key not in scores:
+            elements[key] = element
+            scores[key] = TAG_WEIGHTS.get(element.name, 0) + class_weight(element)
+        scores[key] += score
+
+    for paragraph in soup.find_all(PARAGRAPH_TAGS):
+        text = paragraph.get_text(" ", strip=True)
+        if len(text) < MIN_PARAGRAPH_LENGTH:
+            continue
+        score = 1 + text.count(",") + min(len(text) // 100, 3)
+        add_score(paragraph.parent, score)
+        add_score(paragraph.parent.parent if paragraph.parent else None, score / 2)
+
+    if not scores:
+        return None
+
+    # Link heavy blocks are menus and listings rather than article bodies
+    best_key = max(
+        scores, key=lambda key: scores[key] * (1 - link_density(elements[key]))
+    )
+    return elements[best_key]
+
+
+def extract_main_content(html: str) -> str:
+    """
+    Return the normalized main article text of an HTML page.
+
+    Falls back to the whole page without boilerplate when no block scores as
+    an article body, e.g. for pages that are mostly lists or tables.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    strip_boilerplate(soup)
+
+    candidate = top_candidate(soup)
+    if candidate is not None:
+        content = normalize_whitespace(candidate.get_text("\n"))
+        if len(content) >= MIN_ARTICLE_LENGTH:
+            return content
+
+    return normalize_whitespace((soup.body or soup).get_text("\n"))
@@ -0,0 +1,100 @@
+import re
+import numpy as np
+from config import Config
+from utility.events import PartialSummaryWriter
+from summarization_tools.tools import BaseSummaryTool
+
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+(?=[\"'(\[]?[A-Z0-9])|\n+")
+WORD = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+STOP_WORDS = frozenset(
+    "a an and are as at be been but by can for from had has have he her his i if "
+    "in into is it its may more most not of on or our she so such than that the "
+    "their them then there these they this those to was we were what when which "
+    "who will with would you your".split()
+)
+MIN_SENTENCE_WORDS = 4
+DAMPING = 0.85
+
+
+def split_sentences(text: str) -> list[str]:
+    sentences = (
+        " ".join(sentence.split()) for sentence in SENTENCE_BOUNDARY.split(text)
+    )
+    return [
+        sentence
+        for sentence in sentences
+        if len(sentence.split()) >= MIN_SENTENCE_WORDS
+    ]
+
+
+def tfidf_matrix(sentences: list[str]) -> np.ndarray:
+    """Sentence by term TF-IDF matrix with L2 normalized rows"""
+    vocabulary: dict[str, int] = {}
+    rows, columns = [], []
+    for row, sentence in enumerate(sentences):
+        for word in WORD.findall(sentence.lower()):
+            if word not in STOP_WORDS:
+                rows.append(row)
+                columns.append(vocabulary.setdefault(word, len(vocabulary)))
+
+    counts = np.zeros((len(sentences), len(vocabulary)))
+    np.add.at(counts, (rows, columns), 1)
+    document_frequency = np.count_nonzero(counts, axis=0)
+    idf = np.log((1 + len(sentences)) / (1 + document_frequency)) + 1
+    weights = np.log1p(counts) * idf
+    norms = np.linalg.norm(weights, axis=1, keepdims=True)
+    return weights / np.where(norms == 0, 1, norms)
+
+
+def textrank_scores(
+    similarity: np.ndarray,
+    damping: float = DAMPING,
+    tolerance: float = 1e-6,
+    max_iterations: int = 100,
+) -> np.ndarray:
+    """PageRank by power iteration over a sentence similarity matrix"""
+    size = len(similarity)
+    np.fill_diagonal(similarity, 0)
+    out_weight = similarity.sum(axis=1, keepdims=True)
+    # Sentences sharing no terms with the others link to every sentence evenly
+    transition = np.where(
+        out_weight > 0, similarity / np.where(out_weight == 0, 1, out_weight), 1 / size
+    )
+    scores = np.full(size, 1 / size)
+    for _ in range(max_iterations):
+        updated = (1 - damping) / size + damping * (transition.T @ scores)
+        if np.abs(updated - scores).sum() < tolerance:
+            return updated
+        scores = updated
+    return scores
+
+
+def extract_sentences(text: str, count: int) -> list[str]:
+    """The ``count`` most central sentences of text, in document order"""
+    sentences = split_sentences(text)[: Config.EXTRACTIVE_MAX_SENTENCES]
+    if len(sentences) <= count:
+        return sentences
+    matrix = tfidf_matrix(sentences)
+    scores = textrank_scores(matrix @ matrix.T)
+    top = np.sort(np.argsort(-scores, kind="stable")[:count])
+    return [sentences[index] for index in top]
+
+
+class ExtractiveSummaryTool(BaseSummaryTool):
+    """
+    Local TextRank summarizer, picks the most central sentences of the page
+    without calling a model. Used for plans and requests that trade quality
+    for latency, and as the fallback while the LLM provider is degraded.
+    """
+
+    name = "extractive"
+
+    def summarize(self, writer: PartialSummaryWriter | None = None) -> str:
+        summary = " ".join(
+            extract_sentences(self.document_text(), Config.EXTRACTIVE_SUMMARY_SENTENCES)
+        )
+        if writer is not None:
+            writer.begin()
+            writer.write(summary)
+            writer.flush()
+        return summary
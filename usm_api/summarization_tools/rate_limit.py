@@ -0,0 +1,59 @@
+import time
+from typing import List, Optional
+from utility.rate_limit import (
+    RateLimitExceeded,
+    TokenBucket,
+    TokenBucketStore,
+    get_token_bucket_store,
+)
+
+
+class LLMRateLimiter:
+    """
+    Request and token budget for one LLM, shared by every worker process.
+
+    Waits up to ``max_wait`` seconds are absorbed in place so calls run right
+    at the provider quota; longer ones raise RateLimitExceeded so the task can
+    be retried after ``retry_after`` instead of holding a worker slot.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        max_wait: float,
+        store: Optional[TokenBucketStore] = None,
+    ):
+        self.name = name
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_wait = max_wait
+        self._store = store
+
+    @property
+    def store(self) -> TokenBucketStore:
+        return self._store or get_token_bucket_store()
+
+    def buckets(self, tokens: int) -> List[TokenBucket]:
+        return [
+            TokenBucket(
+                f"llm:{self.name}:requests",
+                self.requests_per_minute,
+                self.requests_per_minute / 60,
+            ),
+            TokenBucket(
+                f"llm:{self.name}:tokens",
+                self.tokens_per_minute,
+                self.tokens_per_minute / 60,
+                cost=tokens,
+            ),
+        ]
+
+    def acquire(self, tokens: int) -> None:
+        waited = 0.0
+        while wait := self.store.consume(self.buckets(tokens)):
+            if waited + wait > self.max_wait:
+                raise RateLimitExceeded(self.name, wait)
+            time.sleep(wait)
+            waited += wait
@@ -1,33 +1,228 @@
-from langchain_community.document_loaders import WebBaseLoader
-from langchain_classic.chains import load_summarize_chain
+from typing import Callable
+from concurrent.futures import ThreadPoolExecutor
+from bs4 import BeautifulSoup
+from langchain_core.documents import Document
+from langchain_classic.chains.summarize import map_reduce_prompt, stuff_prompt
 from langchain_google_genai import ChatGoogleGenerativeAI
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import (
+    retry,
+    retry_if_not_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
 from config import Config
+from utility import logger
+from utility.http import http_fetcher
+from utility.storage import get_page_store
+from summarization_tools.chunking import (
+    approximate_token_count,
+    split_documents,
+    group_by_tokens,
+)
+from summarization_tools.rate_limit import LLMRateLimiter
+from summarization_tools.extraction import extract_main_content
+from utility.rate_limit import RateLimitExceeded
+from utility.cache import ChunkSummaryCache
+from utility.events import PartialSummaryWriter
 
+# Budget shared by every worker calling the model, see utility.rate_limit
+llm_rate_limiter = LLMRateLimiter(
+    Config.SUMMARIZATION_LLM_MODEL,
+    requests_per_minute=Config.SUMMARIZATION_REQUESTS_PER_MINUTE,
+    tokens_per_minute=Config.SUMMARIZATION_TOKENS_PER_MINUTE,
+    max_wait=Config.LLM_RATE_LIMIT_MAX_WAIT,
+)
 
-class SummaryTool:
-    def __init__(self, url: str):
-        self.llm = ChatGoogleGenerativeAI(
-            model=Config.SUMMARIZATION_LLM_MODEL,
-            temperature=0,
-            api_key=Config.LLM_API_KEY,
-        )
-        self.method = "map_reduce"
-        self.document = self.document_loader(url)
-        self.summarizer = load_summarize_chain
+chunk_cache = ChunkSummaryCache()
+
+
+def create_llm() -> ChatGoogleGenerativeAI:
+    return ChatGoogleGenerativeAI(
+        model=Config.SUMMARIZATION_LLM_MODEL,
+        temperature=0,
+        api_key=Config.LLM_API_KEY,
+    )
+
+
+class BaseSummaryTool:
+    """
+    Loads a page into documents for a summarization backend.
+
+    Subclasses implement ``summarize`` and are registered by name in
+    summarization_tools.backends. ``shareable`` backends produce summaries
+    that are cached and coalesced across users.
+    """
+
+    name = "base"
+    shareable = False
+
+    def __init__(
+        self,
+        url: str,
+        page_digest: str | None = None,
+        on_phase: Callable[[str], None] | None = None,
+        documents: list[Document] | None = None,
+    ):
+        self.url = url
+        # Notified as loading moves through the fetching and extracting phases
+        self.on_phase = on_phase or (lambda phase: None)
+        # Documents already loaded by another backend are reused as they are
+        self.document = documents or self.document_loader(url, page_digest)
 
     @retry(
         stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10)
     )
-    def document_loader(self, url: str):
-        loader = WebBaseLoader(url)
-        return loader.load()
+    def document_loader(self, url: str, page_digest: str | None = None):
+        self.on_phase("fetching")
+        html = None
+        # Prefer the page already fetched by the API over the network
+        if page_digest:
+            stored_page = get_page_store().get(page_digest)
+            if stored_page is not None:
+                logger.info(f"Loaded {url} from page store ({page_digest})")
+                html = stored_page.text
+            else:
+                logger.info(f"Page {page_digest} not in store, fetching {url}")
+
+        if html is None:
+            page = http_fetcher.fetch_sync(url)
+            if page.status_code != 200:
+                raise ValueError(f"HTTP status {page.status_code} while loading {url}")
+            html = page.text
+
+        self.on_phase("extracting")
+        return self.build_documents(url, html)
+
+    @staticmethod
+    def build_documents(url: str, html: str):
+        soup = BeautifulSoup(html, "html.parser")
+        metadata = {"source": url}
+        if soup.title and soup.title.string:
+            metadata["title"] = soup.title.string.strip()
+        description = soup.find("meta", attrs={"name": "description"})
+        if description and description.get("content"):
+            metadata["description"] = description.get("content")
+        if soup.html and soup.html.get("lang"):
+            metadata["language"] = soup.html.get("lang")
+
+        # Only the article body is worth tokens, drop navigation and boilerplate
+        raw_tokens = approximate_token_count(soup.get_text())
+        content = extract_main_content(html)
+        content_tokens = approximate_token_count(content)
+        metadata["raw_tokens"] = raw_tokens
+        metadata["content_tokens"] = content_tokens
+        logger.info(
+            f"Extracted main content of {url}, {content_tokens} of {raw_tokens} "
+            f"tokens kept ({raw_tokens - content_tokens} saved)"
+        )
+        return [Document(page_content=content, metadata=metadata)]
+
+    def document_text(self) -> str:
+        return "\n".join(document.page_content for document in self.document)
+
+    def summarize(self, writer: PartialSummaryWriter | None = None) -> str:
+        raise NotImplementedError
+
+
+class SummaryTool(BaseSummaryTool):
+    name = "llm"
+    shareable = True
+
+    def __init__(
+        self,
+        url: str,
+        page_digest: str | None = None,
+        llm: ChatGoogleGenerativeAI | None = None,
+        on_phase: Callable[[str], None] | None = None,
+        documents: list[Document] | None = None,
+    ):
+        # Workers pass their process wide client, see async_tasks.worker
+        self.llm = llm or create_llm()
+        self.stuff_prompt = stuff_prompt.PROMPT
+        self.map_prompt = map_reduce_prompt.PROMPT
+        self.map_prompt_version = ChunkSummaryCache.prompt_version(
+            self.map_prompt.template
+        )
+        self.combine_prompt = map_reduce_prompt.PROMPT
+        self.token_max = Config.SUMMARIZATION_TOKEN_MAX
+        super().__init__(url, page_digest, on_phase, documents)
+        self.method = self.select_method(approximate_token_count(self.document_text()))
+        logger.info(f"Summarizing {url} with {self.method} strategy")
+
+    @staticmethod
+    def select_method(tokens: int) -> str:
+        method = Config.SUMMARIZATION_METHOD
+        if method == "auto":
+            if tokens <= Config.SUMMARIZATION_STUFF_MAX_TOKENS:
+                return "stuff"
+            return "map_reduce"
+        if method not in ("stuff", "map_reduce"):
+            raise ValueError(f"Unknown summarization method {method}")
+        return method
+
+    def chunks(self) -> list[str]:
+        return split_documents(self.document, Config.SUMMARIZATION_CHUNK_TOKENS)
+
+    def combine(self, summaries: list[str]) -> str:
+        return self.combine_prompt.format(text="\n\n".join(summaries))
+
+    def needs_collapse(self, summaries: list[str]) -> bool:
+        return (
+            len(summaries) > 1
+            and approximate_token_count("\n\n".join(summaries)) > self.token_max
+        )
+
+    def call_llm(self, prompt: str) -> str:
+        llm_rate_limiter.acquire(approximate_token_count(prompt))
+        return self.llm.invoke(prompt).text
+
+    def stream_llm(self, prompt: str, writer: PartialSummaryWriter) -> str:
+        """Call the model through its streaming interface, publishing tokens"""
+        llm_rate_limiter.acquire(approximate_token_count(prompt))
+        writer.begin()
+        parts = []
+        for chunk in self.llm.stream(prompt):
+            if chunk.text:
+                parts.append(chunk.text)
+                writer.write(chunk.text)
+        writer.flush()
+        return "".join(parts)
+
+    def map_chunk(self, chunk: str) -> str:
+        # Unchanged chunks are served from earlier attempts and similar pages
+        summary = chunk_cache.get(chunk, self.map_prompt_version)
+        if summary is None:
+            summary = self.call_llm(self.map_prompt.format(text=chunk))
+            chunk_cache.set(chunk, self.map_prompt_version, summary)
+        return summary
 
     @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10)
+        retry=retry_if_not_exception_type(RateLimitExceeded),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
     )
-    def summarize(self):
-        summary = self.summarizer(
-            self.llm, chain_type=self.method, token_max=1000
-        ).invoke(self.document)
-        return summary["output_text"]
+    def summarize(self, writer: PartialSummaryWriter | None = None):
+        # With a writer the final call streams, the map steps are not shown
+        final_call = self.call_llm
+        if writer is not None:
+            final_call = lambda prompt: self.stream_llm(prompt, writer)
+
+        if self.method == "stuff":
+            return final_call(self.stuff_prompt.format(text=self.document_text()))
+
+        # Map chunks in parallel, collapse partials over token_max, then reduce
+        with ThreadPoolExecutor(
+            max_workers=Config.SUMMARIZATION_MAX_CONCURRENCY
+        ) as executor:
+            summaries = list(executor.map(self.map_chunk, self.chunks()))
+            for _ in range(Config.SUMMARIZATION_MAX_COLLAPSE_ROUNDS):
+                if not self.needs_collapse(summaries):
+                    break
+                groups = group_by_tokens(summaries, self.token_max)
+                summaries = list(executor.map(self.call_llm, map(self.combine, groups)))
+            if self.needs_collapse(summaries):
+                logger.warning(
+                    f"Partial summaries of {self.url} still exceed token_max "
+                    f"after {Config.SUMMARIZATION_MAX_COLLAPSE_ROUNDS} rounds"
+                )
+        return final_call(self.combine(summaries))
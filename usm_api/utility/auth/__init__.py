@@ -0,0 +1,7 @@
+from utility.auth.tokens import (
+    access_token_lifetime,
+    issue_access_token,
+    claims_to_user,
+    load_user,
+)
+from utility.auth.revocation import TokenRevocationRegistry
@@ -0,0 +1,66 @@
+import time
+import threading
+from typing import Dict, Optional, Tuple
+from fastapi.concurrency import run_in_threadpool
+from config import Config
+from utility.helper import logger
+from utility.cache import CacheBackend, get_cache_backend
+
+
+class TokenRevocationRegistry:
+    """
+    Versioned token revocation check.
+
+    The user service publishes a user's token version whenever it changes
+    (deactivation, password change). Tokens carrying an older version are
+    rejected. Versions are memoized in process for a short TTL so the shared
+    store is consulted at most once per user per TTL.
+    """
+
+    def __init__(
+        self, backend: Optional[CacheBackend] = None, ttl: Optional[int] = None
+    ):
+        self.backend = backend or get_cache_backend("auth")
+        self.ttl = ttl if ttl is not None else Config.TOKEN_VERSION_CACHE_TTL
+        self._versions: Dict[int, Tuple[float, Optional[int]]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(user_id: int) -> str:
+        return f"token_version:{user_id}"
+
+    def _cached(self, user_id: int) -> Tuple[bool, Optional[int]]:
+        with self._lock:
+            entry = self._versions.get(user_id)
+        if entry is None or entry[0] <= time.monotonic():
+            return False, None
+        return True, entry[1]
+
+    def _remember(self, user_id: int, version: Optional[int]) -> None:
+        with self._lock:
+            self._versions[user_id] = (time.monotonic() + self.ttl, version)
+
+    async def current_version(self, user_id: int) -> Optional[int]:
+        found, version = self._cached(user_id)
+        if found:
+            return version
+        try:
+            version = await run_in_threadpool(self.backend.get, self.make_key(user_id))
+        except Exception as e:
+            # Fail open, tokens stay short-lived and refresh re-checks the DB
+            logger.warning(f"Token version lookup failed for user {user_id} : {e}")
+            return None
+        self._remember(user_id, version)
+        return version
+
+    def publish(self, user_id: int, version: int) -> None:
+        self.backend.set(
+            self.make_key(user_id),
+            version,
+            ttl=Config.REFRESH_TOKEN_LIFETIME_DAYS * 24 * 60 * 60,
+        )
+        self._remember(user_id, version)
+
+    async def is_revoked(self, user_id: int, token_version: int) -> bool:
+        current = await self.current_version(user_id)
+        return current is not None and token_version < current
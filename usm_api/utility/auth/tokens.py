@@ -0,0 +1,75 @@
+import jwt
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from config import Config
+from models import db_models, validator_models
+
+
+def access_token_lifetime() -> timedelta:
+    return timedelta(minutes=Config.ACCESS_TOKEN_LIFETIME_MINUTES)
+
+
+def issue_access_token(user: validator_models.AuthenticatedUser) -> str:
+    """Issue a simplejwt compatible access token with embedded claims"""
+    now = datetime.now(timezone.utc)
+    payload = {
+        "token_type": "access",
+        "exp": now + access_token_lifetime(),
+        "iat": now,
+        "jti": uuid.uuid4().hex,
+        "user_id": user.id,
+        "is_active": user.is_active,
+        "is_staff": user.is_staff,
+        "plan": user.plan,
+        "token_version": user.token_version,
+    }
+    return jwt.encode(payload, Config.SECRET_KEY, algorithm="HS256")
+
+
+def claims_to_user(payload: dict) -> Optional[validator_models.AuthenticatedUser]:
+    """Build the user from token claims, None for tokens issued without them"""
+    if "token_version" not in payload or "is_active" not in payload:
+        return None
+    return validator_models.AuthenticatedUser(
+        id=int(payload["user_id"]),
+        is_active=payload["is_active"],
+        is_staff=payload.get("is_staff", False),
+        plan=payload.get("plan"),
+        token_version=payload["token_version"],
+    )
+
+
+async def load_user(
+    session: AsyncSession, user_id: int
+) -> Optional[validator_models.AuthenticatedUser]:
+    """Resolve the user and their active plan from the database"""
+    row = (
+        await session.execute(
+            select(db_models.User, db_models.SubscriptionPlan.name)
+            .outerjoin(
+                db_models.Subscription,
+                (db_models.Subscription.id == db_models.User.subscription_id)
+                & (db_models.Subscription.is_active == True),
+            )
+            .outerjoin(
+                db_models.SubscriptionPlan,
+                db_models.SubscriptionPlan.id == db_models.Subscription.plan_id,
+            )
+            .where(db_models.User.id == user_id)
+            .limit(1)
+        )
+    ).first()
+    if row is None:
+        return None
+
+    user, plan = row
+    return validator_models.AuthenticatedUser(
+        id=user.id,
+        is_active=user.is_active,
+        is_staff=user.is_staff or user.is_superuser,
+        plan=plan,
+        token_version=user.token_version,
+    )
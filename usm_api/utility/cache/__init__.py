@@ -0,0 +1,10 @@
+from utility.cache.backends import (
+    CacheBackend,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    get_cache_backend,
+    get_redis_client,
+)
+from utility.cache.summary_cache import SummaryCache
+from utility.cache.chunk_cache import ChunkSummaryCache
+from utility.cache.inflight import InFlightRegistry
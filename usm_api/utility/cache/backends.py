@@ -0,0 +1,231 @@
+import json
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import redis
+
+from config import Config
+
+
+class CacheBackend:
+    """Namespaced key/value store with optional per-key TTL."""
+
+    def __init__(self, namespace: str, max_entries: Optional[int] = None):
+        self.namespace = namespace
+        self.max_entries = max_entries
+
+    def make_key(self, key: str) -> str:
+        return f"usm:{self.namespace}:{key}"
+
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def add(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """Set ``key`` only if it does not exist, returning whether it was set."""
+        raise NotImplementedError
+
+    def delete_if_equal(self, key: str, value: Any) -> bool:
+        """Delete ``key`` only while it still holds ``value``."""
+        raise NotImplementedError
+
+    def append(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Append ``value`` to the list stored at ``key``."""
+        raise NotImplementedError
+
+    def pop_all(self, key: str) -> List[Any]:
+        """Atomically read and remove the list stored at ``key``."""
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU stand-in, used for tests and single process deployments."""
+
+    def __init__(self, namespace: str, max_entries: Optional[int] = None):
+        super().__init__(namespace, max_entries)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def _expired(self, expires_at: Optional[float]) -> bool:
+        return expires_at is not None and expires_at <= time.monotonic()
+
+    def get(self, key: str) -> Optional[Any]:
+        key = self.make_key(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if self._expired(expires_at):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return json.loads(payload)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        key = self.make_key(key)
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._entries[key] = (expires_at, json.dumps(value))
+            self._entries.move_to_end(key)
+            if self.max_entries:
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(self.make_key(key), None)
+
+    def add(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        with self._lock:
+            if self.get(key) is not None:
+                return False
+            self.set(key, value, ttl)
+            return True
+
+    def delete_if_equal(self, key: str, value: Any) -> bool:
+        with self._lock:
+            if self.get(key) != value:
+                return False
+            self.delete(key)
+            return True
+
+    def append(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        with self._lock:
+            values = self.get(key) or []
+            values.append(value)
+            self.set(key, values, ttl)
+
+    def pop_all(self, key: str) -> List[Any]:
+        with self._lock:
+            values = self.get(key) or []
+            self.delete(key)
+            return values
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Redis backed store shared by API and worker processes.
+
+    Keys expire through Redis TTLs. When ``max_entries`` is set, a sorted set
+    of last access times is kept per namespace and the least recently used
+    keys are evicted once the namespace grows past the limit.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        max_entries: Optional[int] = None,
+        url: Optional[str] = None,
+    ):
+        super().__init__(namespace, max_entries)
+        self.url = url
+        self.index_key = f"usm:{namespace}:__lru__"
+
+    @property
+    def client(self) -> redis.Redis:
+        return get_redis_client(self.url)
+
+    def get(self, key: str) -> Optional[Any]:
+        key = self.make_key(key)
+        payload = self.client.get(key)
+        if payload is None:
+            if self.max_entries:
+                self.client.zrem(self.index_key, key)
+            return None
+        if self.max_entries:
+            self.client.zadd(self.index_key, {key: time.time()})
+        return json.loads(payload)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        key = self.make_key(key)
+        pipeline = self.client.pipeline()
+        pipeline.set(key, json.dumps(value), ex=ttl)
+        if self.max_entries:
+            pipeline.zadd(self.index_key, {key: time.time()})
+            pipeline.zcard(self.index_key)
+        results = pipeline.execute()
+
+        if self.max_entries and results[-1] > self.max_entries:
+            evicted = self.client.zpopmin(
+                self.index_key, results[-1] - self.max_entries
+            )
+            if evicted:
+                self.client.delete(*[evicted_key for evicted_key, _ in evicted])
+
+    def delete(self, key: str) -> None:
+        key = self.make_key(key)
+        pipeline = self.client.pipeline()
+        pipeline.delete(key)
+        if self.max_entries:
+            pipeline.zrem(self.index_key, key)
+        pipeline.execute()
+
+    def add(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        return bool(
+            self.client.set(self.make_key(key), json.dumps(value), ex=ttl, nx=True)
+        )
+
+    def delete_if_equal(self, key: str, value: Any) -> bool:
+        return bool(
+            self.client.eval(
+                _DELETE_IF_EQUAL_SCRIPT, 1, self.make_key(key), json.dumps(value)
+            )
+        )
+
+    def append(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        key = self.make_key(key)
+        pipeline = self.client.pipeline()
+        pipeline.rpush(key, json.dumps(value))
+        if ttl:
+            pipeline.expire(key, ttl)
+        pipeline.execute()
+
+    def pop_all(self, key: str) -> List[Any]:
+        key = self.make_key(key)
+        pipeline = self.client.pipeline()
+        pipeline.lrange(key, 0, -1)
+        pipeline.delete(key)
+        values, _ = pipeline.execute()
+        return [json.loads(value) for value in values]
+
+
+_DELETE_IF_EQUAL_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+_redis_clients: Dict[str, redis.Redis] = {}
+_memory_backends: Dict[str, MemoryCacheBackend] = {}
+_lock = threading.Lock()
+
+
+def get_redis_client(url: Optional[str] = None) -> redis.Redis:
+    """Return a process wide Redis client (and connection pool) for ``url``."""
+    url = url or Config.CACHE_URL
+    with _lock:
+        if url not in _redis_clients:
+            _redis_clients[url] = redis.Redis.from_url(url)
+        return _redis_clients[url]
+
+
+def get_cache_backend(
+    namespace: str, max_entries: Optional[int] = None
+) -> CacheBackend:
+    """Build the configured cache backend for ``namespace``."""
+    if Config.CACHE_BACKEND == "redis":
+        return RedisCacheBackend(namespace, max_entries)
+
+    with _lock:
+        if namespace not in _memory_backends:
+            _memory_backends[namespace] = MemoryCacheBackend(namespace, max_entries)
+        return _memory_backends[namespace]
@@ -0,0 +1,48 @@
+import hashlib
+from typing import Optional
+
+from config import Config
+from utility.helper import logger
+from utility.cache.backends import CacheBackend, get_cache_backend
+
+
+class ChunkSummaryCache:
+    """
+    Content addressed cache of map phase outputs.
+
+    Entries are keyed by the hash of the chunk text, the LLM model and the
+    version of the map prompt, so they are shared across URLs, users and task
+    retries, and only chunks whose text changed go back to the model.
+    """
+
+    def __init__(
+        self, backend: Optional[CacheBackend] = None, ttl: Optional[int] = None
+    ):
+        self.backend = backend or get_cache_backend(
+            "chunk", max_entries=Config.CHUNK_CACHE_MAX_ENTRIES
+        )
+        self.ttl = ttl or Config.CHUNK_CACHE_TTL
+
+    @staticmethod
+    def prompt_version(template: str) -> str:
+        return hashlib.sha256(template.encode("utf-8")).hexdigest()[:12]
+
+    @staticmethod
+    def make_key(chunk: str, prompt_version: str) -> str:
+        chunk_hash = hashlib.sha256(chunk.encode("utf-8")).hexdigest()
+        return f"{Config.SUMMARIZATION_LLM_MODEL}:{prompt_version}:{chunk_hash}"
+
+    def get(self, chunk: str, prompt_version: str) -> Optional[str]:
+        try:
+            return self.backend.get(self.make_key(chunk, prompt_version))
+        except Exception as e:
+            logger.warning(f"Chunk cache lookup failed : {e}")
+            return None
+
+    def set(self, chunk: str, prompt_version: str, summary: str) -> None:
+        try:
+            self.backend.set(
+                self.make_key(chunk, prompt_version), summary, ttl=self.ttl
+            )
+        except Exception as e:
+            logger.warning(f"Chunk cache store failed : {e}")
@@ -0,0 +1,108 @@
+import hashlib
+from typing import List, Optional
+
+from config import Config
+from utility.helper import Helper
+from utility.cache.backends import CacheBackend, get_cache_backend
+
+
+class InFlightRegistry:
+    """
+    Single-flight registry of summaries currently being generated per URL.
+
+    The first summary row submitted for a canonical URL becomes the leader and
+    is the only one sent to the workers. Rows submitted while the leader is in
+    flight attach as followers and are filled from the leader's result.
+    """
+
+    def __init__(
+        self, backend: Optional[CacheBackend] = None, ttl: Optional[int] = None
+    ):
+        self.backend = backend or get_cache_backend("inflight")
+        self.ttl = ttl or Config.SINGLE_FLIGHT_TTL
+
+    @staticmethod
+    def make_key(url: str) -> str:
+        return hashlib.sha256(Helper.canonicalize_url(url).encode("utf-8")).hexdigest()
+
+    def join(self, url: str, summary_id: int) -> Optional[int]:
+        """
+        Register ``summary_id`` for ``url``.
+
+        Returns the leader id when the row was attached as a follower, or
+        None when the row became the leader and has to be processed.
+        """
+        key = self.make_key(url)
+        leader_key, followers_key = f"{key}:leader", f"{key}:followers"
+
+        if self.backend.add(leader_key, summary_id, ttl=self.ttl):
+            return None
+
+        self.backend.append(followers_key, summary_id, ttl=self.ttl)
+        leader_id = self.backend.get(leader_key)
+        if leader_id is not None:
+            return leader_id
+
+        # Leader completed before we attached, start a new flight instead
+        if self.backend.add(leader_key, summary_id, ttl=self.ttl):
+            return None
+        return self.backend.get(leader_key)
+
+    def leader(self, url: str) -> Optional[int]:
+        """Leader of the flight for ``url``, None once the flight is gone"""
+        return self.backend.get(f"{self.make_key(url)}:leader")
+
+    def promote(self, url: str, queue_class: str) -> bool:
+        """
+        Record that a row of ``queue_class`` waits on the flight for ``url``.
+
+        Returns True when the class outranks every class recorded for the
+        flight so far, the leader then has to be queued in it as well so
+        followers never wait behind a lower class backlog.
+        """
+        classes = list(Config.SUMMARIZATION_QUEUES)
+        class_key = f"{self.make_key(url)}:class"
+        current = self.backend.get(class_key)
+        if current in classes and classes.index(current) <= classes.index(queue_class):
+            return False
+        self.backend.set(class_key, queue_class, ttl=self.ttl)
+        return True
+
+    def queue_class(self, url: str) -> Optional[str]:
+        """Highest queue class among the rows of the flight for ``url``"""
+        return self.backend.get(f"{self.make_key(url)}:class")
+
+    def complete(self, url: str, leader_id: int) -> List[int]:
+        """Close the flight led by ``leader_id`` and return the followers to fill."""
+        key = self.make_key(url)
+        self.backend.delete(f"{key}:class")
+        self.backend.delete_if_equal(f"{key}:leader", leader_id)
+        followers = self.backend.pop_all(f"{key}:followers")
+        return [follower_id for follower_id in followers if follower_id != leader_id]
+
+    def abandon(self, url: str, leader_id: int) -> Optional[int]:
+        """
+        Hand the flight over after the leader failed.
+
+        The first follower is promoted to leader and returned so it can be
+        dispatched; the remaining followers stay attached to it.
+        """
+        key = self.make_key(url)
+        leader_key, followers_key = f"{key}:leader", f"{key}:followers"
+
+        self.backend.delete_if_equal(leader_key, leader_id)
+        followers = [
+            follower_id
+            for follower_id in self.backend.pop_all(followers_key)
+            if follower_id != leader_id
+        ]
+        if not followers:
+            return None
+
+        new_leader_id = followers[0]
+        promoted = self.backend.add(leader_key, new_leader_id, ttl=self.ttl)
+        remaining = followers[1:] if promoted else followers
+        for follower_id in remaining:
+            self.backend.append(followers_key, follower_id, ttl=self.ttl)
+
+        return new_leader_id if promoted else None
@@ -0,0 +1,48 @@
+import hashlib
+from typing import Optional
+
+from config import Config
+from utility.helper import logger, Helper
+from utility.cache.backends import CacheBackend, get_cache_backend
+
+
+class SummaryCache:
+    """
+    Cross-user cache of generated summaries.
+
+    Entries are keyed by the canonical form of the URL, the hash of the
+    fetched document and the LLM model, so a summary is only reused when the
+    page content it was generated from is unchanged.
+    """
+
+    def __init__(
+        self, backend: Optional[CacheBackend] = None, ttl: Optional[int] = None
+    ):
+        self.backend = backend or get_cache_backend(
+            "summary", max_entries=Config.SUMMARY_CACHE_MAX_ENTRIES
+        )
+        self.ttl = ttl or Config.SUMMARY_CACHE_TTL
+
+    @staticmethod
+    def content_hash(content: str) -> str:
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def make_key(url: str, content_hash: str) -> str:
+        url_hash = hashlib.sha256(
+            Helper.canonicalize_url(url).encode("utf-8")
+        ).hexdigest()
+        return f"{Config.SUMMARIZATION_LLM_MODEL}:{url_hash}:{content_hash}"
+
+    def get(self, url: str, content_hash: str) -> Optional[str]:
+        try:
+            return self.backend.get(self.make_key(url, content_hash))
+        except Exception as e:
+            logger.warning(f"Summary cache lookup failed for {url} : {e}")
+            return None
+
+    def set(self, url: str, content_hash: str, summary: str) -> None:
+        try:
+            self.backend.set(self.make_key(url, content_hash), summary, ttl=self.ttl)
+        except Exception as e:
+            logger.warning(f"Summary cache store failed for {url} : {e}")
@@ -1 +1,8 @@
-from utility.database.sql_utils import SessionLocal, get_sql_session
+from utility.database.sql_utils import (
+    SessionLocal,
+    configure_engine,
+    dispose_engine,
+    AsyncSessionLocal,
+    get_sql_session,
+    get_async_sql_session,
+)
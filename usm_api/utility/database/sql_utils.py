@@ -1,10 +1,39 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from config import Config
 
-engine = create_engine(Config.SQL_DB_URL, pool_pre_ping=True)
+engine = create_engine(
+    Config.SQL_DB_URL, pool_pre_ping=True, pool_recycle=Config.SQL_POOL_RECYCLE
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine used by the API handlers, the sync one stays for the workers
+async_engine = create_async_engine(Config.SQL_ASYNC_DB_URL, pool_pre_ping=True)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+
+def configure_engine(pool_size: int, max_overflow: int):
+    """Rebuild the sync engine with a pool sized for the calling worker process"""
+    global engine
+    # Connections inherited from a parent process must not be closed here
+    engine.dispose(close=False)
+    engine = create_engine(
+        Config.SQL_DB_URL,
+        pool_pre_ping=True,
+        pool_recycle=Config.SQL_POOL_RECYCLE,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+    )
+    SessionLocal.configure(bind=engine)
+    return engine
+
+
+def dispose_engine() -> None:
+    engine.dispose()
+
 
 def get_sql_session():
     db: Session = SessionLocal()
@@ -12,3 +41,8 @@ def get_sql_session():
         yield db
     finally:
         db.close()
+
+
+async def get_async_sql_session():
+    async with AsyncSessionLocal() as db:
+        yield db
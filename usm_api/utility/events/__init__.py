@@ -0,0 +1,3 @@
+from utility.events.bus import EventBus, RedisEventBus, MemoryEventBus, get_event_bus
+from utility.events.hub import EventHub, event_hub
+from utility.events.partial import PartialSummaryStore, PartialSummaryWriter
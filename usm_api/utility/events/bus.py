@@ -0,0 +1,93 @@
+import json
+import asyncio
+import threading
+from typing import AsyncIterator, List, Optional, Tuple
+
+import redis.asyncio as aioredis
+
+from config import Config
+from utility.cache import get_redis_client
+
+CHANNEL_PREFIX = "usm:events:"
+
+
+class EventBus:
+    """
+    Per-user summary events published by the workers and consumed by the API.
+
+    ``publish`` is synchronous so it can be called from Celery tasks, while
+    ``listen`` is an async iterator over events for every user, consumed once
+    per API process.
+    """
+
+    def publish(self, user_id: int, event: dict) -> None:
+        raise NotImplementedError
+
+    def listen(self) -> AsyncIterator[Tuple[int, dict]]:
+        raise NotImplementedError
+
+
+class RedisEventBus(EventBus):
+    def __init__(self, url: Optional[str] = None):
+        self.url = url or Config.CACHE_URL
+
+    def publish(self, user_id: int, event: dict) -> None:
+        get_redis_client(self.url).publish(
+            f"{CHANNEL_PREFIX}{user_id}", json.dumps(event)
+        )
+
+    async def listen(self) -> AsyncIterator[Tuple[int, dict]]:
+        client = aioredis.Redis.from_url(self.url)
+        pubsub = client.pubsub()
+        await pubsub.psubscribe(f"{CHANNEL_PREFIX}*")
+        try:
+            async for message in pubsub.listen():
+                if message["type"] != "pmessage":
+                    continue
+                channel = message["channel"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode("utf-8")
+                user_id = int(channel[len(CHANNEL_PREFIX) :])
+                yield user_id, json.loads(message["data"])
+        finally:
+            await pubsub.aclose()
+            await client.aclose()
+
+
+class MemoryEventBus(EventBus):
+    """In-process stand-in, events published from any thread reach listeners"""
+
+    def __init__(self):
+        self._listeners: List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = []
+        self._lock = threading.Lock()
+
+    def publish(self, user_id: int, event: dict) -> None:
+        with self._lock:
+            listeners = list(self._listeners)
+        for loop, queue in listeners:
+            loop.call_soon_threadsafe(queue.put_nowait, (user_id, event))
+
+    async def listen(self) -> AsyncIterator[Tuple[int, dict]]:
+        listener = (asyncio.get_running_loop(), asyncio.Queue())
+        with self._lock:
+            self._listeners.append(listener)
+        try:
+            while True:
+                yield await listener[1].get()
+        finally:
+            with self._lock:
+                self._listeners.remove(listener)
+
+
+_event_bus: Optional[EventBus] = None
+
+
+def get_event_bus() -> EventBus:
+    """Return the configured event bus for this process."""
+    global _event_bus
+    if _event_bus is None:
+        if Config.CACHE_BACKEND == "redis":
+            _event_bus = RedisEventBus()
+        else:
+            _event_bus = MemoryEventBus()
+    return _event_bus
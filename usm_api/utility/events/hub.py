@@ -0,0 +1,66 @@
+import asyncio
+from collections import defaultdict
+from typing import Dict, Optional, Set
+
+from utility.helper import logger
+from utility.events.bus import EventBus, get_event_bus
+
+
+class EventHub:
+    """
+    Fans events from a single bus subscription out to the streams of the
+    users connected to this API process.
+    """
+
+    def __init__(self, bus: Optional[EventBus] = None, queue_size: int = 100):
+        self._bus = bus
+        self.queue_size = queue_size
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = defaultdict(set)
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def bus(self) -> EventBus:
+        return self._bus or get_event_bus()
+
+    def subscribe(self, user_id: int) -> asyncio.Queue:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._consume())
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers[user_id].add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: int, queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(user_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[user_id]
+
+    async def _consume(self) -> None:
+        while True:
+            try:
+                async for user_id, event in self.bus.listen():
+                    for queue in list(self._subscribers.get(user_id, ())):
+                        if queue.full():
+                            # Slow consumer, drop its oldest event
+                            queue.get_nowait()
+                        queue.put_nowait(event)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Event bus subscription failed, reconnecting : {e}")
+                await asyncio.sleep(1)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# One hub per API process
+event_hub = EventHub()
@@ -0,0 +1,104 @@
+import time
+from typing import Optional
+
+from config import Config
+from utility.helper import logger
+from utility.cache import CacheBackend, get_cache_backend
+from utility.events.bus import EventBus, get_event_bus
+
+
+class PartialSummaryStore:
+    """
+    Text generated so far for summaries being streamed, so clients that
+    connect in the middle of a generation can catch up before following
+    the delta events.
+    """
+
+    def __init__(
+        self, backend: Optional[CacheBackend] = None, ttl: Optional[int] = None
+    ):
+        self.backend = backend or get_cache_backend("partial")
+        self.ttl = ttl or Config.SUMMARY_STREAM_TTL
+
+    def get(self, summary_id: int) -> Optional[str]:
+        return self.backend.get(str(summary_id))
+
+    def set(self, summary_id: int, text: str) -> None:
+        self.backend.set(str(summary_id), text, ttl=self.ttl)
+
+    def delete(self, summary_id: int) -> None:
+        self.backend.delete(str(summary_id))
+
+
+class PartialSummaryWriter:
+    """
+    Publishes the streamed output of a summary as it is generated.
+
+    Tokens are buffered and flushed at most every ``flush_interval`` seconds
+    as a ``summary.delta`` event carrying the offset of its text, while the
+    whole text so far is kept in the PartialSummaryStore. ``begin`` publishes
+    an empty ``summary.partial`` event, which tells clients to start over when
+    a generation is retried. Publishing is best effort and never raises.
+    """
+
+    def __init__(
+        self,
+        user_id: int,
+        summary_id: int,
+        store: Optional[PartialSummaryStore] = None,
+        bus: Optional[EventBus] = None,
+        flush_interval: Optional[float] = None,
+    ):
+        self.user_id = user_id
+        self.summary_id = summary_id
+        self.store = store or PartialSummaryStore()
+        self.bus = bus or get_event_bus()
+        self.flush_interval = (
+            Config.SUMMARY_STREAM_FLUSH_INTERVAL
+            if flush_interval is None
+            else flush_interval
+        )
+        self.text = ""
+        self.flushed = 0
+        self.flushed_at = 0.0
+
+    def _publish(self, event_type: str, offset: int, text: str) -> None:
+        try:
+            self.store.set(self.summary_id, self.text)
+            self.bus.publish(
+                self.user_id,
+                {
+                    "type": event_type,
+                    "id": self.summary_id,
+                    "offset": offset,
+                    "text": text,
+                },
+            )
+        except Exception as e:
+            logger.warning(
+                f"Error in streaming partial summary {self.summary_id} : {e}"
+            )
+
+    def begin(self) -> None:
+        self.text, self.flushed = "", 0
+        self.flushed_at = time.monotonic()
+        self._publish("summary.partial", 0, "")
+
+    def write(self, text: str) -> None:
+        self.text += text
+        if time.monotonic() - self.flushed_at >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        if len(self.text) == self.flushed:
+            return
+        offset, self.flushed = self.flushed, len(self.text)
+        self.flushed_at = time.monotonic()
+        self._publish("summary.delta", offset, self.text[offset:])
+
+    def close(self) -> None:
+        """Drop the stored text once the final summary is committed"""
+        try:
+            self.store.delete(self.summary_id)
+        except Exception as e:
+            logger.warning(f"Error in clearing partial summary {self.summary_id} : {e}")
@@ -1,18 +1,25 @@
-import requests
-from urllib.parse import urlparse
+import json
+import base64
+import httpx
+from datetime import datetime
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
 import re
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
+from utility.http import http_fetcher
 
 
 class Helper:
 
     @staticmethod
-    def is_webpage_with_content(
+    async def is_webpage_with_content(
         url: str, timeout: int = 10, min_content_length: int = 100
     ) -> Dict[str, any]:
         """
         Check if a URL is a webpage with actual content.
 
+        Uses a single bounded GET through the shared HTTP pool; the fetched
+        page is returned under "page" so callers can reuse the body.
+
         Args:
             url: The URL to check
             timeout: Request timeout in seconds
@@ -132,6 +139,7 @@ class Helper:
             "status_code": None,
             "error": None,
             "details": "",
+            "page": None,
         }
 
         try:
@@ -149,95 +157,42 @@ class Helper:
                 result["details"] = "URL has non-webpage file extension"
                 return result
 
-            # Step 3: Make HEAD request first to check content type
-            try:
-                head_response = requests.head(
-                    normalized_url,
-                    timeout=timeout,
-                    allow_redirects=True,
-                    headers={
-                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                    },
-                )
-                result["status_code"] = head_response.status_code
-
-                # Check if status code indicates success
-                if head_response.status_code != 200:
-                    result["details"] = (
-                        f"HTTP status {head_response.status_code} - not accessible"
-                    )
-                    return result
-
-                content_type = head_response.headers.get("content-type", "").split(";")[
-                    0
-                ]
-                result["content_type"] = content_type
-
-                # Check if content type indicates webpage
-                if not is_webpage_content_type(content_type):
-                    result["details"] = (
-                        f'Content type "{content_type}" is not a webpage'
-                    )
-                    return result
-
-            except requests.exceptions.RequestException as e:
-                result["error"] = f"HEAD request failed: {str(e)}"
-                # Continue to try GET request as fallback
-
-            # Step 4: Make GET request to verify content
+            # Step 3: Single bounded GET, reusing pooled connections
             try:
-                get_response = requests.get(
-                    normalized_url,
-                    timeout=timeout,
-                    allow_redirects=True,
-                    headers={
-                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                    },
-                    stream=True,  # Stream to avoid downloading large files
-                )
-
-                result["status_code"] = get_response.status_code
-
-                if get_response.status_code != 200:
-                    result["details"] = (
-                        f"HTTP status {get_response.status_code} - not accessible"
-                    )
-                    return result
-
-                # Get content length
-                content_length = get_response.headers.get("content-length")
-                if content_length:
-                    result["content_length"] = int(content_length)
-                else:
-                    # Read first few bytes to estimate content
-                    chunk = get_response.content[:1024]
-                    result["content_length"] = len(chunk)
-
-                # Get actual content type from GET response
-                content_type = get_response.headers.get("content-type", "").split(";")[
-                    0
-                ]
-                result["content_type"] = content_type
-
-                # Final verification
-                is_webpage = is_webpage_content_type(content_type)
-                has_content = result["content_length"] >= min_content_length
-
-                result["is_webpage"] = is_webpage
-                result["has_content"] = has_content
-
-                if is_webpage and has_content:
-                    result["details"] = (
-                        f'Webpage with {result["content_length"]} bytes of content'
-                    )
-                elif is_webpage and not has_content:
-                    result["details"] = "Webpage but little or no content"
-                else:
-                    result["details"] = f"Not a webpage (Content-Type: {content_type})"
-
-            except requests.exceptions.RequestException as e:
+                page = await http_fetcher.fetch(normalized_url, timeout=timeout)
+            except httpx.HTTPError as e:
                 result["error"] = f"GET request failed: {str(e)}"
                 result["details"] = "Failed to fetch content"
+                return result
+
+            result["status_code"] = page.status_code
+            result["content_type"] = page.content_type
+
+            if page.status_code != 200:
+                result["details"] = f"HTTP status {page.status_code} - not accessible"
+                return result
+
+            # Check if content type indicates webpage
+            if not is_webpage_content_type(page.content_type):
+                result["details"] = (
+                    f'Content type "{page.content_type}" is not a webpage'
+                )
+                return result
+
+            result["content_length"] = len(page.body)
+            result["page"] = page
+
+            # Final verification
+            has_content = result["content_length"] >= min_content_length
+            result["is_webpage"] = True
+            result["has_content"] = has_content
+
+            if has_content:
+                result["details"] = (
+                    f'Webpage with {result["content_length"]} bytes of content'
+                )
+            else:
+                result["details"] = "Webpage but little or no content"
 
         except Exception as e:
             result["error"] = f"Unexpected error: {str(e)}"
@@ -246,10 +201,67 @@ class Helper:
         return result
 
     @staticmethod
-    def is_webpage(url: str, timeout: int = 5) -> bool:
+    async def is_webpage(url: str, timeout: int = 5) -> bool:
         """Simple check if URL is a webpage (returns boolean only)"""
         try:
-            result = Helper.is_webpage_with_content(url, timeout)
+            result = await Helper.is_webpage_with_content(url, timeout)
             return result["is_webpage"] and result["has_content"]
         except:
             return False
+
+    @staticmethod
+    def canonicalize_url(url: str) -> str:
+        """
+        Normalize a URL so that equivalent spellings share one cache key.
+
+        Lowercases scheme and host, drops default ports, fragments and
+        tracking parameters, and sorts the remaining query parameters.
+        """
+        url = url.strip()
+        if not re.match(r"^https?://", url, re.IGNORECASE):
+            url = "https://" + url
+
+        parsed = urlparse(url)
+        scheme = parsed.scheme.lower()
+        host = (parsed.hostname or "").lower().rstrip(".")
+        if host.startswith("www."):
+            host = host[4:]
+
+        netloc = host
+        if parsed.port and (scheme, parsed.port) not in (("http", 80), ("https", 443)):
+            netloc = f"{host}:{parsed.port}"
+
+        path = re.sub(r"/{2,}", "/", parsed.path or "/")
+
+        tracking_params = ("utm_", "fbclid", "gclid", "mc_cid", "mc_eid", "ref_src")
+        query = sorted(
+            (key, value)
+            for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+            if not key.lower().startswith(tracking_params)
+        )
+
+        return urlunparse((scheme, netloc, path, "", urlencode(query), ""))
+
+    @staticmethod
+    def encode_cursor(updated_at: datetime, id: int) -> str:
+        """Opaque keyset pagination cursor for a (updated_at, id) position"""
+        payload = json.dumps([updated_at.isoformat(), id]).encode("utf-8")
+        return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+        """Decode a cursor from encode_cursor, raising ValueError if malformed"""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            updated_at, id = json.loads(base64.urlsafe_b64decode(padded))
+            return datetime.fromisoformat(updated_at), int(id)
+        except Exception as e:
+            raise ValueError("Invalid pagination cursor") from e
+
+    @staticmethod
+    def percentile(samples: List[float], fraction: float) -> Optional[float]:
+        """Nearest rank percentile of ``samples``, None when there are none"""
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
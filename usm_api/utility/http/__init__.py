@@ -0,0 +1 @@
+from utility.http.fetcher import FetchedPage, HttpFetcher, http_fetcher
@@ -0,0 +1,184 @@
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+import httpx
+
+from config import Config
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+
+@dataclass
+class FetchedPage:
+    url: str
+    status_code: int
+    content_type: str
+    body: bytes
+    truncated: bool = False
+    encoding: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(self.encoding or "utf-8", errors="replace")
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status_code == 304
+
+    @property
+    def validators(self) -> Dict[str, Optional[str]]:
+        """Cache validators to send back on a conditional GET"""
+        return {
+            "etag": self.headers.get("etag"),
+            "last_modified": self.headers.get("last-modified"),
+        }
+
+
+class HttpFetcher:
+    """
+    Pooled HTTP client shared by URL validation in the API and document
+    loading in the workers.
+
+    Connections are kept alive per host and negotiated over HTTP/2 where the
+    server supports it. Every fetch is a single GET whose body is read up to
+    ``max_bytes``, so oversized responses are never downloaded in full.
+    """
+
+    def __init__(
+        self,
+        timeout: float = Config.HTTP_TIMEOUT,
+        max_bytes: int = Config.FETCH_MAX_BYTES,
+        max_connections: int = Config.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections: int = Config.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    ):
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._sync_client: Optional[httpx.Client] = None
+
+    def configure_limits(
+        self, max_connections: int, max_keepalive_connections: int
+    ) -> None:
+        """Resize the connection pools, open clients are rebuilt on next use"""
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self.close()
+        # The async client cannot be awaited from here, drop it so the next
+        # use builds one with the new limits
+        self._async_client = None
+
+    def _client_options(self) -> dict:
+        return {
+            "http2": True,
+            "limits": self.limits,
+            "timeout": self.timeout,
+            "follow_redirects": True,
+            "headers": {"User-Agent": USER_AGENT},
+        }
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        if self._async_client is None or self._async_client.is_closed:
+            self._async_client = httpx.AsyncClient(**self._client_options())
+        return self._async_client
+
+    @property
+    def sync_client(self) -> httpx.Client:
+        if self._sync_client is None or self._sync_client.is_closed:
+            self._sync_client = httpx.Client(**self._client_options())
+        return self._sync_client
+
+    @staticmethod
+    def _conditional_headers(
+        etag: Optional[str], last_modified: Optional[str]
+    ) -> Dict[str, str]:
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    @staticmethod
+    def _build_page(
+        response: httpx.Response, body: bytearray, max_bytes: int
+    ) -> FetchedPage:
+        return FetchedPage(
+            url=str(response.url),
+            status_code=response.status_code,
+            content_type=response.headers.get("content-type", "").split(";")[0],
+            body=bytes(body[:max_bytes]),
+            truncated=len(body) > max_bytes,
+            encoding=response.encoding,
+            headers=dict(response.headers),
+        )
+
+    async def fetch(
+        self,
+        url: str,
+        max_bytes: Optional[int] = None,
+        timeout: Optional[float] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> FetchedPage:
+        """
+        GET url, conditionally when validators of an earlier response are
+        given, in which case an unchanged page comes back as a bodiless 304.
+        """
+        max_bytes = max_bytes or self.max_bytes
+        body = bytearray()
+        async with self.async_client.stream(
+            "GET",
+            url,
+            timeout=timeout or self.timeout,
+            headers=self._conditional_headers(etag, last_modified),
+        ) as response:
+            async for chunk in response.aiter_bytes():
+                body.extend(chunk)
+                if len(body) > max_bytes:
+                    break
+            return self._build_page(response, body, max_bytes)
+
+    def fetch_sync(
+        self,
+        url: str,
+        max_bytes: Optional[int] = None,
+        timeout: Optional[float] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> FetchedPage:
+        """Blocking variant of fetch, used by the workers"""
+        max_bytes = max_bytes or self.max_bytes
+        body = bytearray()
+        with self.sync_client.stream(
+            "GET",
+            url,
+            timeout=timeout or self.timeout,
+            headers=self._conditional_headers(etag, last_modified),
+        ) as response:
+            for chunk in response.iter_bytes():
+                body.extend(chunk)
+                if len(body) > max_bytes:
+                    break
+            return self._build_page(response, body, max_bytes)
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    def close(self) -> None:
+        if self._sync_client is not None:
+            self._sync_client.close()
+            self._sync_client = None
+
+
+# Shared per process so connections are reused across requests and tasks
+http_fetcher = HttpFetcher()
@@ -0,0 +1,6 @@
+from utility.queueing.fair_queue import (
+    FairQueue,
+    MemoryFairQueue,
+    RedisFairQueue,
+    get_fair_queue,
+)
@@ -0,0 +1,214 @@
+import json
+import time
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+import redis
+
+from config import Config
+from utility.cache import get_redis_client
+from utility.helper import Helper
+
+# Recent queue waits kept per class for percentile reporting
+WAIT_SAMPLES = 1000
+
+
+class FairQueue:
+    """
+    Per-class queues of pending work, served fairly across users.
+
+    Every user with pending items has a virtual time that advances by one per
+    served item, and ``pop`` always serves the user with the lowest one. Users
+    joining a class start at the class clock, so a user with a large backlog
+    gets one turn per round like everyone else instead of blocking them.
+    """
+
+    def make_key(self, queue_class: str, key: str) -> str:
+        return f"usm:queue:{queue_class}:{key}"
+
+    def push(self, queue_class: str, user_id: int, items: List[Dict[str, Any]]):
+        raise NotImplementedError
+
+    def pop(self, queue_class: str, count: int) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def stats(self, queue_class: str) -> Dict[str, Any]:
+        """Pending items, users waiting and recent queue wait percentiles."""
+        raise NotImplementedError
+
+    @staticmethod
+    def wrap(item: Dict[str, Any]) -> Dict[str, Any]:
+        return {**item, "enqueued_at": time.time()}
+
+    @staticmethod
+    def summarize_waits(pending: int, users: int, waits: List[float]) -> dict:
+        return {
+            "pending": pending,
+            "users": users,
+            "wait_samples": len(waits),
+            "wait_p50": Helper.percentile(waits, 0.50),
+            "wait_p95": Helper.percentile(waits, 0.95),
+            "wait_p99": Helper.percentile(waits, 0.99),
+        }
+
+
+class MemoryFairQueue(FairQueue):
+    """In-process stand-in, used for tests and single process deployments."""
+
+    def __init__(self):
+        self._users: Dict[str, Dict[int, deque]] = {}
+        self._virtual_times: Dict[str, Dict[int, float]] = {}
+        self._clocks: Dict[str, float] = {}
+        self._waits: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def push(self, queue_class: str, user_id: int, items: List[Dict[str, Any]]):
+        with self._lock:
+            users = self._users.setdefault(queue_class, {})
+            virtual_times = self._virtual_times.setdefault(queue_class, {})
+            if user_id not in users:
+                users[user_id] = deque()
+                virtual_times[user_id] = self._clocks.get(queue_class, 0.0)
+            users[user_id].extend(self.wrap(item) for item in items)
+
+    def pop(self, queue_class: str, count: int) -> List[Dict[str, Any]]:
+        popped = []
+        with self._lock:
+            users = self._users.get(queue_class, {})
+            virtual_times = self._virtual_times.get(queue_class, {})
+            waits = self._waits.setdefault(queue_class, deque(maxlen=WAIT_SAMPLES))
+            while users and len(popped) < count:
+                user_id = min(users, key=virtual_times.__getitem__)
+                item = users[user_id].popleft()
+                self._clocks[queue_class] = virtual_times[user_id]
+                virtual_times[user_id] += 1
+                if not users[user_id]:
+                    del users[user_id], virtual_times[user_id]
+                waits.append(time.time() - item["enqueued_at"])
+                popped.append(item)
+        return popped
+
+    def stats(self, queue_class: str) -> Dict[str, Any]:
+        with self._lock:
+            users = self._users.get(queue_class, {})
+            return self.summarize_waits(
+                sum(len(items) for items in users.values()),
+                len(users),
+                list(self._waits.get(queue_class, [])),
+            )
+
+
+class RedisFairQueue(FairQueue):
+    """
+    Queues kept in Redis, shared by the API and every worker.
+
+    Each class has a list per user, a sorted set of users scored by virtual
+    time, a clock and a pending counter, all updated by Lua scripts.
+    """
+
+    def __init__(self, url: Optional[str] = None):
+        self.url = url
+
+    @property
+    def client(self) -> redis.Redis:
+        return get_redis_client(self.url)
+
+    def push(self, queue_class: str, user_id: int, items: List[Dict[str, Any]]):
+        if not items:
+            return
+        self.client.eval(
+            _PUSH_SCRIPT,
+            4,
+            self.make_key(queue_class, f"user:{user_id}"),
+            self.make_key(queue_class, "users"),
+            self.make_key(queue_class, "clock"),
+            self.make_key(queue_class, "pending"),
+            user_id,
+            *[json.dumps(self.wrap(item)) for item in items],
+        )
+
+    def pop(self, queue_class: str, count: int) -> List[Dict[str, Any]]:
+        if count <= 0:
+            return []
+        payloads = self.client.eval(
+            _POP_SCRIPT,
+            3,
+            self.make_key(queue_class, "users"),
+            self.make_key(queue_class, "clock"),
+            self.make_key(queue_class, "pending"),
+            count,
+            self.make_key(queue_class, "user:"),
+        )
+        popped = [json.loads(payload) for payload in payloads]
+        if popped:
+            now = time.time()
+            waits_key = self.make_key(queue_class, "waits")
+            pipeline = self.client.pipeline()
+            pipeline.lpush(waits_key, *[now - item["enqueued_at"] for item in popped])
+            pipeline.ltrim(waits_key, 0, WAIT_SAMPLES - 1)
+            pipeline.execute()
+        return popped
+
+    def stats(self, queue_class: str) -> Dict[str, Any]:
+        pipeline = self.client.pipeline()
+        pipeline.get(self.make_key(queue_class, "pending"))
+        pipeline.zcard(self.make_key(queue_class, "users"))
+        pipeline.lrange(self.make_key(queue_class, "waits"), 0, -1)
+        pending, users, waits = pipeline.execute()
+        return self.summarize_waits(
+            int(pending or 0), users, [float(wait) for wait in waits]
+        )
+
+
+_PUSH_SCRIPT = """
+if not redis.call("zscore", KEYS[2], ARGV[1]) then
+    local clock = tonumber(redis.call("get", KEYS[3])) or 0
+    redis.call("zadd", KEYS[2], clock, ARGV[1])
+end
+for i = 2, #ARGV do
+    redis.call("rpush", KEYS[1], ARGV[i])
+end
+redis.call("incrby", KEYS[4], #ARGV - 1)
+return #ARGV - 1
+"""
+
+_POP_SCRIPT = """
+local popped = {}
+while #popped < tonumber(ARGV[1]) do
+    local head = redis.call("zrange", KEYS[1], 0, 0, "withscores")
+    if #head == 0 then
+        break
+    end
+    local user_key = ARGV[2] .. head[1]
+    local item = redis.call("lpop", user_key)
+    if item then
+        table.insert(popped, item)
+    end
+    redis.call("set", KEYS[2], head[2])
+    if redis.call("llen", user_key) == 0 then
+        redis.call("zrem", KEYS[1], head[1])
+    else
+        redis.call("zincrby", KEYS[1], 1, head[1])
+    end
+end
+if #popped > 0 then
+    redis.call("decrby", KEYS[3], #popped)
+end
+return popped
+"""
+
+_memory_queue: Optional[MemoryFairQueue] = None
+_lock = threading.Lock()
+
+
+def get_fair_queue() -> FairQueue:
+    """Build the configured fair queue, following CACHE_BACKEND."""
+    global _memory_queue
+    if Config.CACHE_BACKEND == "redis":
+        return RedisFairQueue()
+
+    with _lock:
+        if _memory_queue is None:
+            _memory_queue = MemoryFairQueue()
+        return _memory_queue
@@ -0,0 +1,8 @@
+from utility.rate_limit.buckets import (
+    RateLimitExceeded,
+    TokenBucket,
+    TokenBucketStore,
+    MemoryTokenBucketStore,
+    RedisTokenBucketStore,
+    get_token_bucket_store,
+)
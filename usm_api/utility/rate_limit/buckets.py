@@ -0,0 +1,168 @@
+import math
+import time
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import redis
+
+from config import Config
+from utility.cache import get_redis_client
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a bucket has no budget left, ``retry_after`` is in seconds."""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"Rate limit {name} exceeded, retry after {retry_after:.2f}s")
+        self.name = name
+        self.retry_after = retry_after
+
+
+@dataclass
+class TokenBucket:
+    """
+    Bucket holding up to ``capacity`` tokens, refilled at ``refill_rate`` per
+    second, from which one acquisition takes ``cost`` tokens.
+    """
+
+    key: str
+    capacity: float
+    refill_rate: float
+    cost: float = 1
+
+    @property
+    def ttl(self) -> int:
+        # A bucket left alone this long is full again, same as a missing one
+        return math.ceil(self.capacity / self.refill_rate) + 1
+
+
+class TokenBucketStore:
+    """
+    Store of token buckets shared by every process using it.
+
+    ``consume`` takes the cost from all buckets at once or from none of them,
+    so a request is only charged when every limit it is subject to allows it.
+    """
+
+    namespace = "ratelimit"
+
+    def make_key(self, key: str) -> str:
+        return f"usm:{self.namespace}:{key}"
+
+    def consume(self, buckets: List[TokenBucket]) -> float:
+        """Take from ``buckets``, returning 0 or the seconds until they allow it."""
+        raise NotImplementedError
+
+    async def aconsume(self, buckets: List[TokenBucket]) -> float:
+        return await asyncio.to_thread(self.consume, buckets)
+
+
+class MemoryTokenBucketStore(TokenBucketStore):
+    """In-process stand-in, used for tests and single process deployments."""
+
+    def __init__(self):
+        self._buckets: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+
+    def consume(self, buckets: List[TokenBucket]) -> float:
+        with self._lock:
+            now = time.monotonic()
+            levels, wait = [], 0.0
+            for bucket in buckets:
+                tokens, updated_at = self._buckets.get(
+                    self.make_key(bucket.key), (bucket.capacity, now)
+                )
+                tokens = min(
+                    bucket.capacity, tokens + (now - updated_at) * bucket.refill_rate
+                )
+                cost = min(bucket.cost, bucket.capacity)
+                if tokens < cost:
+                    wait = max(wait, (cost - tokens) / bucket.refill_rate)
+                levels.append(tokens - cost)
+
+            if wait:
+                return wait
+            for bucket, tokens in zip(buckets, levels):
+                self._buckets[self.make_key(bucket.key)] = (tokens, now)
+            return 0.0
+
+    async def aconsume(self, buckets: List[TokenBucket]) -> float:
+        # Never blocks on I/O, no need for a thread
+        return self.consume(buckets)
+
+
+class RedisTokenBucketStore(TokenBucketStore):
+    """Buckets kept in Redis hashes and updated atomically by a Lua script."""
+
+    def __init__(self, url: Optional[str] = None):
+        self.url = url
+
+    @property
+    def client(self) -> redis.Redis:
+        return get_redis_client(self.url)
+
+    def consume(self, buckets: List[TokenBucket]) -> float:
+        arguments = []
+        for bucket in buckets:
+            arguments += [
+                bucket.capacity,
+                bucket.refill_rate,
+                min(bucket.cost, bucket.capacity),
+                bucket.ttl,
+            ]
+        wait = self.client.eval(
+            _CONSUME_SCRIPT,
+            len(buckets),
+            *[self.make_key(bucket.key) for bucket in buckets],
+            *arguments,
+        )
+        return float(wait)
+
+
+# Uses the Redis clock so workers with skewed clocks share one timeline
+_CONSUME_SCRIPT = """
+local clock = redis.call("time")
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local levels = {}
+local wait = 0
+
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 4 - 3])
+    local rate = tonumber(ARGV[i * 4 - 2])
+    local cost = tonumber(ARGV[i * 4 - 1])
+    local state = redis.call("hmget", key, "tokens", "ts")
+    local tokens = tonumber(state[1]) or capacity
+    local updated_at = tonumber(state[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * rate)
+    if tokens < cost then
+        wait = math.max(wait, (cost - tokens) / rate)
+    end
+    levels[i] = tokens - cost
+end
+
+if wait > 0 then
+    return tostring(wait)
+end
+for i, key in ipairs(KEYS) do
+    redis.call("hset", key, "tokens", tostring(levels[i]), "ts", tostring(now))
+    redis.call("expire", key, ARGV[i * 4])
+end
+return "0"
+"""
+
+_memory_store: Optional[MemoryTokenBucketStore] = None
+_lock = threading.Lock()
+
+
+def get_token_bucket_store(backend: Optional[str] = None) -> TokenBucketStore:
+    """Build the token bucket store for ``backend``, CACHE_BACKEND by default."""
+    global _memory_store
+    if (backend or Config.CACHE_BACKEND) == "redis":
+        return RedisTokenBucketStore()
+
+    with _lock:
+        if _memory_store is None:
+            _memory_store = MemoryTokenBucketStore()
+        return _memory_store
@@ -0,0 +1,7 @@
+from utility.storage.page_store import (
+    StoredPage,
+    PageStore,
+    LocalPageStore,
+    MemoryPageStore,
+    get_page_store,
+)
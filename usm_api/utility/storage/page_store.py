@@ -0,0 +1,189 @@
+import os
+import json
+import zlib
+import struct
+import hashlib
+import tempfile
+import threading
+from pathlib import Path
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from config import Config
+from utility.helper import logger
+from utility.http import FetchedPage
+
+
+@dataclass
+class StoredPage:
+    digest: str
+    url: str
+    content_type: str
+    body: bytes
+    encoding: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(self.encoding or "utf-8", errors="replace")
+
+
+class PageStore:
+    """
+    Content-addressed store of fetched page bodies.
+
+    Pages are addressed by the SHA-256 digest of their body, which lets the
+    API hand a page it already downloaded to the worker by digest alone.
+    """
+
+    @staticmethod
+    def digest(body: bytes) -> str:
+        return hashlib.sha256(body).hexdigest()
+
+    def put(self, page: FetchedPage) -> str:
+        raise NotImplementedError
+
+    def get(self, digest: str) -> Optional[StoredPage]:
+        raise NotImplementedError
+
+    @staticmethod
+    def encode(page: FetchedPage) -> bytes:
+        header = json.dumps(
+            {
+                "url": page.url,
+                "content_type": page.content_type,
+                "encoding": page.encoding,
+            }
+        ).encode("utf-8")
+        return struct.pack(">I", len(header)) + header + zlib.compress(page.body)
+
+    @staticmethod
+    def decode(digest: str, blob: bytes) -> StoredPage:
+        (header_length,) = struct.unpack(">I", blob[:4])
+        header = json.loads(blob[4 : 4 + header_length])
+        return StoredPage(
+            digest=digest,
+            url=header["url"],
+            content_type=header["content_type"],
+            encoding=header["encoding"],
+            body=zlib.decompress(blob[4 + header_length :]),
+        )
+
+
+class LocalPageStore(PageStore):
+    """
+    Compressed pages on a local (or shared) disk, sharded by digest prefix.
+
+    Reads refresh the file mtime, and once the store grows past ``max_bytes``
+    the least recently used pages are deleted down to 90% of the cap.
+    """
+
+    def __init__(self, root: str, max_bytes: int):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def _scan(self):
+        return [path for path in self.root.glob("*/*") if path.is_file()]
+
+    def put(self, page: FetchedPage) -> str:
+        digest = self.digest(page.body)
+        path = self._path(digest)
+        if path.exists():
+            os.utime(path)
+            return digest
+
+        blob = self.encode(page)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as tmp:
+            tmp.write(blob)
+        os.replace(tmp.name, path)
+
+        with self._lock:
+            if self._size is None:
+                self._size = sum(item.stat().st_size for item in self._scan())
+            else:
+                self._size += len(blob)
+            if self._size > self.max_bytes:
+                self._evict()
+        return digest
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self._scan():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        for _, entry_size, path in sorted(entries):
+            if size <= target:
+                break
+            path.unlink(missing_ok=True)
+            size -= entry_size
+        self._size = size
+        logger.info(f"Evicted pages from store, {size} bytes remaining")
+
+    def get(self, digest: str) -> Optional[StoredPage]:
+        path = self._path(digest)
+        try:
+            blob = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return self.decode(digest, blob)
+
+
+class MemoryPageStore(PageStore):
+    """In-process LRU stand-in for an object store, bounded by compressed size."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._blobs: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def put(self, page: FetchedPage) -> str:
+        digest = self.digest(page.body)
+        blob = self.encode(page)
+        with self._lock:
+            if digest in self._blobs:
+                self._blobs.move_to_end(digest)
+                return digest
+            self._blobs[digest] = blob
+            self._size += len(blob)
+            while self._size > self.max_bytes and len(self._blobs) > 1:
+                _, evicted = self._blobs.popitem(last=False)
+                self._size -= len(evicted)
+        return digest
+
+    def get(self, digest: str) -> Optional[StoredPage]:
+        with self._lock:
+            blob = self._blobs.get(digest)
+            if blob is None:
+                return None
+            self._blobs.move_to_end(digest)
+        return self.decode(digest, blob)
+
+
+_page_store: Optional[PageStore] = None
+
+
+def get_page_store() -> PageStore:
+    """Return the configured page store for this process."""
+    global _page_store
+    if _page_store is None:
+        if Config.PAGE_STORE_BACKEND == "memory":
+            _page_store = MemoryPageStore(Config.PAGE_STORE_MAX_BYTES)
+        else:
+            _page_store = LocalPageStore(
+                Config.PAGE_STORE_DIR, Config.PAGE_STORE_MAX_BYTES
+            )
+    return _page_store
@@ -110,7 +110,9 @@ REST_FRAMEWORK = {
 }
 
 SIMPLE_JWT = {
-    "ACCESS_TOKEN_LIFETIME": timedelta(hours=5),
+    "ACCESS_TOKEN_LIFETIME": timedelta(
+        minutes=int(os.getenv("ACCESS_TOKEN_LIFETIME_MINUTES", "15"))
+    ),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
     "ROTATE_REFRESH_TOKENS": False,
     "BLACKLIST_AFTER_ROTATION": False,
@@ -127,3 +129,6 @@ CORS_ALLOWED_ORIGINS = [
 ]
 
 SUMMARIZER_HOST = os.getenv("SUMMARIZER_HOST")
+
+# Redis the summarizer service reads token versions from
+TOKEN_REVOCATION_URL = os.getenv("CACHE_URL", os.getenv("BROKER_URL"))
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class UsmUserConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "usm_user"
+
+    def ready(self):
+        from usm_user import signals  # noqa: F401
@@ -0,0 +1,28 @@
+from django.db.models.signals import pre_save, post_save
+from django.dispatch import receiver
+from usm_user.models import User
+from usm_user.tokens import publish_token_version
+
+
+@receiver(pre_save, sender=User)
+def bump_token_version(sender, instance, **kwargs):
+    # Deactivation and password changes invalidate issued tokens
+    if instance.pk is None:
+        return
+    previous = sender.objects.filter(pk=instance.pk).only("is_active", "password")
+    previous = previous.first()
+    if previous is None:
+        return
+    if (
+        previous.is_active != instance.is_active
+        or previous.password != instance.password
+    ):
+        instance.token_version += 1
+        instance._token_version_changed = True
+
+
+@receiver(post_save, sender=User)
+def revoke_outstanding_tokens(sender, instance, **kwargs):
+    if getattr(instance, "_token_version_changed", False):
+        publish_token_version(instance)
+        instance._token_version_changed = False
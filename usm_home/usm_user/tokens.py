@@ -0,0 +1,33 @@
+import json
+import redis
+from django.conf import settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+def issue_tokens(user):
+    """
+    Issue a refresh/access token pair carrying the claims the summarizer
+    service needs to authorize requests without a database lookup.
+    """
+    refresh_token = RefreshToken.for_user(user)
+    refresh_token["is_active"] = user.is_active
+    refresh_token["is_staff"] = user.is_staff or user.is_superuser
+    refresh_token["token_version"] = user.token_version
+    refresh_token["plan"] = None
+    if user.subscription and user.subscription.is_active:
+        refresh_token["plan"] = user.subscription.plan.name
+
+    # Access token copies the custom claims of the refresh token
+    return str(refresh_token.access_token), str(refresh_token)
+
+
+def publish_token_version(user):
+    """Publish the user's token version so outstanding tokens are rejected"""
+    if not settings.TOKEN_REVOCATION_URL:
+        return
+    client = redis.Redis.from_url(settings.TOKEN_REVOCATION_URL)
+    client.set(
+        f"usm:auth:token_version:{user.id}",
+        json.dumps(user.token_version),
+        ex=int(settings.SIMPLE_JWT["REFRESH_TOKEN_LIFETIME"].total_seconds()),
+    )
@@ -3,7 +3,7 @@ from rest_framework import status
 from rest_framework.response import Response
 from usm_user.serializers import AuthenticationRequestSerializer
 from django.contrib.auth import get_user_model
-from rest_framework_simplejwt.tokens import AccessToken
+from usm_user.tokens import issue_tokens
 from usm_user.models import SubscriptionPlan, Subscription
 from rest_framework.permissions import IsAuthenticated
 from usm_user.serializers import UserDetailsSerializer
@@ -44,11 +44,12 @@ class SignupView(APIView):
         user_object.set_password(validated_data["password"])
         user_object.save()
 
-        # Create JWT Token for the user
-        access_token = AccessToken.for_user(user_object)
+        # Create JWT Tokens for the user
+        access_token, refresh_token = issue_tokens(user_object)
 
         response_content = {
-            "access_token": str(access_token),
+            "access_token": access_token,
+            "refresh_token": refresh_token,
             "user_email": user_object.email,
             "msg": "User created successfully",
         }
@@ -80,11 +81,12 @@ class LoginView(APIView):
                 {"error": "Invalid credentials"}, status=status.HTTP_401_UNAUTHORIZED
             )
 
-        # Create JWT Token for the user
-        access_token = AccessToken.for_user(user_object)
+        # Create JWT Tokens for the user
+        access_token, refresh_token = issue_tokens(user_object)
 
         response_content = {
-            "access_token": str(access_token),
+            "access_token": access_token,
+            "refresh_token": refresh_token,
             "user_email": user_object.email,
             "msg": "Login successful",
         }